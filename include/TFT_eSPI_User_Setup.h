@@ -21,26 +21,44 @@
 #define TFT_RST  -1  // Reset disabled - this specific display doesn't work with RST connected
 
 // Touch disabled (using physical buttons)
-#define TOUCH_CS -1  // Required by TFT_eSPI even when not using touch
+// The display has the SPI bus to itself - no touch controller shares it,
+// so the bus never has to be re-clocked between devices mid-frame
+#define TOUCH_CS -1  // Defined (as -1) only to silence TFT_eSPI's missing-touch warning
 
-// Use VSPI (default for ESP32)
-#define VSPI_HOST
+// SPI host: TFT_eSPI drives the ESP32's VSPI (SPI3) peripheral unless
+// USE_HSPI_PORT is defined, so no host define is needed here. (VSPI_HOST
+// is an ESP-IDF enum constant - defining it as an empty macro would
+// silently break any IDF code that names it, e.g. TFT_eSPI's DMA setup)
 
 // Fonts to be available
+// Only the built-in GLCD font is used (all text is drawn with setTextSize
+// scaling); the other bitmap fonts and smooth-font support would only
+// take up flash
 #define LOAD_GLCD   // Font 1. Original Adafruit 8 pixel font needs ~1820 bytes in FLASH
-#define LOAD_FONT2  // Font 2. Small 16 pixel high font, needs ~3534 bytes in FLASH
-#define LOAD_FONT4  // Font 4. Medium 26 pixel high font, needs ~5848 bytes in FLASH
-#define LOAD_FONT6  // Font 6. Large 48 pixel font, needs ~2666 bytes in FLASH
-#define LOAD_FONT7  // Font 7. 7 segment 48 pixel font, needs ~2438 bytes in FLASH
-#define LOAD_FONT8  // Font 8. Large 75 pixel font, needs ~3256 bytes in FLASH
 
-// Smooth fonts
-#define SMOOTH_FONT
-
-// SPI Frequency (Testing 10 MHz for better performance)
-#define SPI_FREQUENCY        10000000  // 10 MHz (increased from 250 kHz)
+// SPI Frequency
+// 10 MHz is the rate proven on this panel. MOSI (23) and SCLK (18) are the
+// native IOMUX pins of VSPI, so the bus can also run at up to 40 MHz
+// (80 MHz APB / 2) - opt in from platformio.ini build_flags with e.g.
+// -DTFT_SPI_FREQUENCY=40000000 once that rate has been verified on the board
+#ifdef TFT_SPI_FREQUENCY
+#define SPI_FREQUENCY        TFT_SPI_FREQUENCY
+#else
+#define SPI_FREQUENCY        10000000  // 10 MHz
+#endif
 #define SPI_READ_FREQUENCY   10000000  // 10 MHz
-#define SPI_TOUCH_FREQUENCY  2500000   // 2.5 MHz (conservative for touch if ever used)
+// If a touch controller is ever added on this bus, TFT_eSPI switches to
+// SPI_TOUCH_FREQUENCY only for the duration of each touch read
+#define SPI_TOUCH_FREQUENCY  2500000   // 2.5 MHz (XPT2046-safe)
+
+// DMA (initDMA/pushImageDMA) is deliberately NOT used: TFT_eSPI's ILI9488
+// driver expands every RGB565 pixel to 3 bytes on the CPU, so its DMA path
+// isn't available for this controller. Bulk throughput instead comes from
+// large single-window writes (fillRect, pushSprite) and from holding the bus
+// with startWrite()/endWrite() around groups of small draws.
 
-// Color depth (16-bit RGB565)
+// Color depth: colors are specified as 16-bit RGB565 in code, but the
+// ILI9488 only accepts 18-bit RGB666 over SPI (COLMOD 0x66 - its 16-bit
+// mode works on the parallel interface only). TFT_eSPI's ILI9488 driver
+// therefore sends 3 bytes per pixel; no 16-bit SPI mode exists to switch to
 #define TFT_RGB_ORDER TFT_BGR  // ILI9488 uses BGR ordering
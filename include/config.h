@@ -36,6 +36,7 @@
 #define BT_MAC_ADDRESS      "9C:9C:1F:C7:63:A6"       // MAC address (primary)
 #define BT_USE_MAC          true                       // Use MAC instead of name
 #define BT_PIN              "1234"                     // PIN (often not needed)
+#define BT_PIN_FALLBACK     "0000"                     // Tried if BT_PIN fails
 
 // Connection Settings
 #define BT_RECONNECT_DELAY_MS   5000   // Wait 5s before reconnect attempt
@@ -77,11 +78,15 @@
 // ELM327 Settings
 #define ELM327_BAUD_RATE        38400  // ELM327 standard baud rate
 #define ELM327_TIMEOUT_MS       2000   // 2s timeout for commands
-#define ELM327_INIT_DELAY_MS    2000   // Wait 2s after connection
+#define ELM327_RX_POLL_MS       1      // Idle wait while the RX queue is empty (one RTOS tick)
+#define ELM327_INIT_DELAY_MS    2000   // Max wait for the adapter's first prompt after connecting
+#define ELM327_RX_BUFFER_SIZE   256    // Response buffer (multi-line DTC/VIN replies fit)
 
 // OBD2 Query Settings
-#define OBD2_QUERY_INTERVAL_MS  200    // 5 Hz = query every 200ms (faster updates!)
-#define OBD2_MAX_RETRIES        3      // Retry failed queries 3 times
+#define OBD2_QUERY_GAP_MS       5      // Yield between queries - the ELM327 '>' prompt paces the loop
+#define MAX_PIDS_PER_REQUEST    6      // ELM327 limit for one combined Mode 01 request
+#define LIVE_SAMPLE_QUEUE_LEN   24     // Live samples buffered between OBD2 task and display (4 full batches)
+#define DTC_COMMAND_QUEUE_LEN   4      // Pending DTC refresh/clear requests from the UI
 
 // Supported PIDs (Mode 01)
 #define PID_COOLANT_TEMP        0x05   // Engine coolant temperature
@@ -97,9 +102,17 @@
 
 // FreeRTOS Task Configuration (OBD2 runs on Core 0, Display runs in main loop on Core 1)
 #define OBD2_TASK_STACK_SIZE    8192   // 8KB stack for OBD2 task
-#define OBD2_TASK_PRIORITY      1      // Priority 1 (lower)
+#define OBD2_TASK_PRIORITY      3      // Above the display loop (loopTask = 1): ELM327 replies must be read promptly
 #define OBD2_TASK_CORE          0      // Run on Core 0
 
+// ============================================================================
+// DEBUG CONFIGURATION
+// ============================================================================
+
+#define DEBUG_BLUETOOTH         false  // Verbose Bluetooth connection logging
+#define DEBUG_DISPLAY           false  // Per-frame / per-step render tracing
+#define DEBUG_OBD               false  // Per-sample live PID readings
+
 // ============================================================================
 // VEHICLE INFORMATION
 // ============================================================================
@@ -10,6 +10,8 @@
 #ifndef BUTTON_NAV_H
 #define BUTTON_NAV_H
 
+#include <soc/gpio_reg.h>
+#include <driver/gpio.h>
 #include "ui_common.h"
 #include "../obd2/obd_data.h"
 #include "dtc_page.h"  // For scrollDTCUp/Down functions
@@ -21,6 +23,11 @@
 
 #define DEBOUNCE_DELAY_MS 500  // Button debounce delay (increased to prevent rapid page changes)
 
+#define GPIO_BIT(pin) (1ULL << (pin))
+
+// All navigation buttons as one GPIO bitmask (configured and sampled together)
+#define BUTTON_GPIO_MASK (GPIO_BIT(BTN_LEFT) | GPIO_BIT(BTN_RIGHT) | GPIO_BIT(BTN_SELECT))
+
 // ============================================================================
 // BUTTON DEFINITIONS
 // ============================================================================
@@ -48,39 +55,111 @@ struct UIButton {
     Page page;            // Which page this button belongs to (PAGE_MAX = all pages)
 };
 
-// Global button array
-static UIButton ui_buttons[] = {
-    // Bottom Navigation (always visible on all pages)
-    {BTN_NAV_DASHBOARD, 0,   BOTTOM_NAV_Y, NAV_BUTTON_WIDTH, BOTTOM_NAV_HEIGHT, true, (Page)99},  // Page 99 = always visible
-    {BTN_NAV_DTC,       160, BOTTOM_NAV_Y, NAV_BUTTON_WIDTH, BOTTOM_NAV_HEIGHT, true, (Page)99},
-    {BTN_NAV_CONFIG,    320, BOTTOM_NAV_Y, NAV_BUTTON_WIDTH, BOTTOM_NAV_HEIGHT, true, (Page)99},
-
-    // DTC Page Buttons (only visible on DTC page)
-    {BTN_DTC_REFRESH, 290, CONTENT_Y_START + 3, 90, 26, true, PAGE_DTC},
-    {BTN_DTC_CLEAR,   390, CONTENT_Y_START + 3, 85, 26, true, PAGE_DTC},
-    {BTN_DTC_UP,      80,  BOTTOM_NAV_Y - 48, 140, 38, false, PAGE_DTC},  // Enabled dynamically
-    {BTN_DTC_DOWN,    260, BOTTOM_NAV_Y - 48, 140, 38, false, PAGE_DTC},  // Enabled dynamically
+// Global button array (declared here, defined once in display_manager.cpp -
+// this header is included by more than one file, so a static array here
+// would give each file its own copy)
+extern UIButton ui_buttons[BTN_MAX];
+
+// Button geometry is fixed at compile time, so it is validated here once
+// instead of on every highlight draw: each button must lie fully on screen
+// and be large enough for the 2px inner highlight ring
+#define HIGHLIGHT_THICKNESS 2
+
+constexpr bool isValidButtonGeometry(int x, int y, int w, int h) {
+    return x >= 0 && y >= 0 &&
+           x + w <= SCREEN_WIDTH && y + h <= SCREEN_HEIGHT &&
+           w - 2 * HIGHLIGHT_THICKNESS > 4 && h - 2 * HIGHLIGHT_THICKNESS > 4;
+}
+
+static_assert(isValidButtonGeometry(NAV_DASHBOARD_X, BOTTOM_NAV_Y, NAV_BUTTON_WIDTH, BOTTOM_NAV_HEIGHT), "Dashboard nav button geometry");
+static_assert(isValidButtonGeometry(NAV_DTC_X, BOTTOM_NAV_Y, NAV_BUTTON_WIDTH, BOTTOM_NAV_HEIGHT), "DTC nav button geometry");
+static_assert(isValidButtonGeometry(NAV_CONFIG_X, BOTTOM_NAV_Y, NAV_BUTTON_WIDTH, BOTTOM_NAV_HEIGHT), "Config nav button geometry");
+static_assert(isValidButtonGeometry(DTC_REFRESH_X, DTC_BTN_Y, DTC_REFRESH_WIDTH, DTC_BTN_HEIGHT), "DTC refresh button geometry");
+static_assert(isValidButtonGeometry(DTC_CLEAR_X, DTC_BTN_Y, DTC_CLEAR_WIDTH, DTC_BTN_HEIGHT), "DTC clear button geometry");
+static_assert(isValidButtonGeometry(DTC_UP_X, DTC_SCROLL_Y, DTC_SCROLL_WIDTH, DTC_SCROLL_HEIGHT), "DTC up button geometry");
+static_assert(isValidButtonGeometry(DTC_DOWN_X, DTC_SCROLL_Y, DTC_SCROLL_WIDTH, DTC_SCROLL_HEIGHT), "DTC down button geometry");
+
+// Button background colors by ButtonID (used to clear the highlight ring)
+// Nav buttons list their inactive color; the active page's button is GRAY
+static const uint16_t BUTTON_BG_COLORS[BTN_MAX] = {
+    COLOR_DARKGRAY,  // BTN_NAV_DASHBOARD
+    COLOR_DARKGRAY,  // BTN_NAV_DTC
+    COLOR_DARKGRAY,  // BTN_NAV_CONFIG
+    COLOR_BLUE,      // BTN_DTC_REFRESH
+    COLOR_RED,       // BTN_DTC_CLEAR
+    COLOR_BLUE,      // BTN_DTC_UP
+    COLOR_BLUE,      // BTN_DTC_DOWN
 };
 
 // Current highlighted button index (declared here, defined in obdeck.ino)
 extern int current_button_index;
 
+/**
+ * Check a button index with a single unsigned compare
+ * (negative values wrap around to large unsigned numbers)
+ */
+inline bool isValidButtonIndex(int index) {
+    return (unsigned)index < (unsigned)BTN_MAX;
+}
+
 // ============================================================================
 // BUTTON INITIALIZATION
 // ============================================================================
 
+// Set from the GPIO ISR on any button's falling edge, cleared when the
+// main loop samples the buttons (interrupt only flags - no work in ISR)
+static volatile bool button_edge_pending = true;  // Sample once at startup
+static TaskHandle_t button_notify_task = NULL;    // Main loop task, woken on an edge
+
+static unsigned long last_button_time = 0;  // Last handled press (debounce)
+static bool button_held = false;            // A button was down at the last sample
+
+static void IRAM_ATTR onButtonEdge(void* arg) {
+    button_edge_pending = true;
+    if (button_notify_task != NULL) {
+        BaseType_t woken = pdFALSE;
+        vTaskNotifyGiveFromISR(button_notify_task, &woken);
+        if (woken) {
+            portYIELD_FROM_ISR();
+        }
+    }
+}
+
 /**
  * Initialize physical button GPIO pins
+ * One gpio_config() call sets up all buttons from BUTTON_GPIO_MASK
+ * (input with pull-up, same as pinMode(INPUT_PULLUP) per pin), with a
+ * falling-edge interrupt so idle polls can skip sampling entirely
  */
 inline void initButtonNav() {
-    pinMode(BTN_LEFT, INPUT_PULLUP);
-    pinMode(BTN_RIGHT, INPUT_PULLUP);
-    pinMode(BTN_SELECT, INPUT_PULLUP);
-
-    Serial.println("✓ Button navigation initialized");
-    Serial.printf("  LEFT=GPIO%d, RIGHT=GPIO%d, SELECT=GPIO%d\n",
-                  BTN_LEFT, BTN_RIGHT, BTN_SELECT);
-    Serial.printf("  Starting with button %d highlighted\n", current_button_index);
+    const gpio_config_t button_config = {
+        .pin_bit_mask = BUTTON_GPIO_MASK,
+        .mode = GPIO_MODE_INPUT,
+        .pull_up_en = GPIO_PULLUP_ENABLE,
+        .pull_down_en = GPIO_PULLDOWN_DISABLE,
+        .intr_type = GPIO_INTR_NEGEDGE,   // Press = falling edge (active LOW)
+    };
+    if (gpio_config(&button_config) != ESP_OK) {
+        Serial.println("ERROR: Button GPIO configuration failed!");
+    }
+
+    // The calling task (Arduino loop) sleeps until an edge wakes it
+    button_notify_task = xTaskGetCurrentTaskHandle();
+
+    // Per-pin ISR dispatch (INVALID_STATE = service already installed)
+    esp_err_t err = gpio_install_isr_service(0);
+    if (err == ESP_OK || err == ESP_ERR_INVALID_STATE) {
+        gpio_isr_handler_add((gpio_num_t)BTN_LEFT, onButtonEdge, NULL);
+        gpio_isr_handler_add((gpio_num_t)BTN_RIGHT, onButtonEdge, NULL);
+        gpio_isr_handler_add((gpio_num_t)BTN_SELECT, onButtonEdge, NULL);
+    } else {
+        Serial.println("ERROR: Button interrupt setup failed!");
+    }
+
+    Serial.printf("✓ Button navigation initialized\n"
+                  "  LEFT=GPIO%d, RIGHT=GPIO%d, SELECT=GPIO%d\n"
+                  "  Starting with button %d highlighted\n",
+                  BTN_LEFT, BTN_RIGHT, BTN_SELECT, current_button_index);
 }
 
 // ============================================================================
@@ -125,7 +204,7 @@ inline void updateButtonVisibility(Page current_page, int dtc_count, int dtc_scr
 
     // Safety check: if current button is not visible/enabled on current page,
     // reset to the appropriate nav button for this page
-    if (current_button_index >= 0 && current_button_index < BTN_MAX) {
+    if (isValidButtonIndex(current_button_index)) {
         UIButton& current_btn = ui_buttons[current_button_index];
 
         // Check if current button should be visible on current page
@@ -186,7 +265,7 @@ inline int getVisibleButtons(Page current_page, int* visible_buttons) {
  * @param current_page Current active page (needed to determine nav button colors)
  */
 inline void drawButtonHighlight(int button_index, bool show, Page current_page) {
-    if (button_index < 0 || button_index >= BTN_MAX) {
+    if (!isValidButtonIndex(button_index)) {
         return;
     }
 
@@ -196,61 +275,24 @@ inline void drawButtonHighlight(int button_index, bool show, Page current_page)
         return;
     }
 
-    // Safety check: ensure coordinates are within screen bounds
-    if (btn.x < 0 || btn.y < 0 || btn.x + btn.w > SCREEN_WIDTH || btn.y + btn.h > SCREEN_HEIGHT) {
-        return;
-    }
-
-    if (show) {
-        // Draw white highlight INSIDE button boundaries (2 pixels thick)
-        // This prevents overlap with content areas above/below buttons
-        for (int i = 0; i < 2; i++) {
-            int x = btn.x + i + 1;
-            int y = btn.y + i + 1;
-            int w = btn.w - ((i + 1) * 2);
-            int h = btn.h - ((i + 1) * 2);
-
-            // Only draw if valid dimensions
-            if (w > 4 && h > 4) {
-                tft.drawRect(x, y, w, h, COLOR_WHITE);
-            }
-        }
-    } else {
-        // Clear highlight by redrawing button border area
-        // Since highlight is inside button, we redraw the inner border area in button's background color
-        for (int i = 0; i < 2; i++) {
-            int x = btn.x + i + 1;
-            int y = btn.y + i + 1;
-            int w = btn.w - ((i + 1) * 2);
-            int h = btn.h - ((i + 1) * 2);
-
-            // Only draw if valid dimensions
-            if (w > 4 && h > 4) {
-                // Determine clear color based on button type
-                uint16_t clear_color = COLOR_BLACK;
-
-                if (btn.id >= BTN_NAV_DASHBOARD && btn.id <= BTN_NAV_CONFIG) {
-                    // Nav buttons: check if this button is the active page
-                    bool is_active_page = false;
-                    if (btn.id == BTN_NAV_DASHBOARD && current_page == PAGE_DASHBOARD) is_active_page = true;
-                    if (btn.id == BTN_NAV_DTC && current_page == PAGE_DTC) is_active_page = true;
-                    if (btn.id == BTN_NAV_CONFIG && current_page == PAGE_CONFIG) is_active_page = true;
-
-                    // Use GRAY for active page button, DARKGRAY for inactive
-                    clear_color = is_active_page ? COLOR_GRAY : COLOR_DARKGRAY;
-                } else if (btn.id == BTN_DTC_REFRESH) {
-                    clear_color = COLOR_BLUE;  // Refresh button background
-                } else if (btn.id == BTN_DTC_CLEAR) {
-                    clear_color = COLOR_RED;  // Clear All button background
-                } else if (btn.id == BTN_DTC_UP || btn.id == BTN_DTC_DOWN) {
-                    // Scroll buttons: use BLUE if enabled, DARKGRAY if disabled
-                    clear_color = btn.enabled ? COLOR_BLUE : COLOR_DARKGRAY;
-                }
-
-                tft.drawRect(x, y, w, h, clear_color);
-            }
+    // Highlight ring sits INSIDE button boundaries (2 pixels thick)
+    // This prevents overlap with content areas above/below buttons
+    // (bounds and minimum size are checked at compile time above)
+    uint16_t color = COLOR_WHITE;
+    if (!show) {
+        // Clear highlight by redrawing the ring in the button's background color
+        // (disabled buttons returned above, so scroll buttons are always BLUE)
+        color = BUTTON_BG_COLORS[btn.id];
+
+        // Nav button IDs match their page numbers - active page uses GRAY
+        if (btn.id <= BTN_NAV_CONFIG && (int)btn.id == (int)current_page) {
+            color = COLOR_GRAY;
         }
     }
+
+    // Ring as 4 thick bands (4 address windows instead of 8 single-pixel
+    // edge lines)
+    drawFrame(btn.x + 1, btn.y + 1, btn.w - 2, btn.h - 2, HIGHLIGHT_THICKNESS, color);
 }
 
 /**
@@ -260,7 +302,7 @@ inline void drawButtonHighlight(int button_index, bool show, Page current_page)
  */
 inline void refreshButtonHighlight(Page current_page) {
     // Only refresh if current button is valid and enabled
-    if (current_button_index >= 0 && current_button_index < BTN_MAX) {
+    if (isValidButtonIndex(current_button_index)) {
         if (ui_buttons[current_button_index].enabled) {
             drawButtonHighlight(current_button_index, true, current_page);
         }
@@ -373,6 +415,7 @@ inline bool activateButton(Page& current_page, bool& page_needs_redraw, int dtc_
                 Serial.println("[Button] Switching to DTC page");
                 current_page = PAGE_DTC;
                 page_needs_redraw = true;
+                resetDTCScroll();  // Always open DTC list at the top
                 // Keep DTC button highlighted after page change
                 current_button_index = BTN_NAV_DTC;
                 Serial.printf("[Button] Set current_button_index = %d (DTC)\n", current_button_index);
@@ -393,31 +436,31 @@ inline bool activateButton(Page& current_page, bool& page_needs_redraw, int dtc_
         // DTC Actions
         case BTN_DTC_REFRESH:
             Serial.println("[Button] Refresh DTCs requested");
-            // Set flag for OBD2 task to handle (thread-safe)
-            xSemaphoreTake(data_mutex, portMAX_DELAY);
-            obd_data.dtc_refresh_requested = true;
-            xSemaphoreGive(data_mutex);
+            // Queue for OBD2 task to handle (never blocks the UI)
+            if (!requestDTCCommand(DTC_CMD_REFRESH)) {
+                Serial.println("[Button] DTC request queue full - ignored");
+            }
             return true;
 
         case BTN_DTC_CLEAR:
             Serial.println("[Button] Clear all DTCs requested");
-            // Set flag for OBD2 task to handle (thread-safe)
-            xSemaphoreTake(data_mutex, portMAX_DELAY);
-            obd_data.dtc_clear_requested = true;
-            xSemaphoreGive(data_mutex);
+            // Queue for OBD2 task to handle (never blocks the UI)
+            if (!requestDTCCommand(DTC_CMD_CLEAR)) {
+                Serial.println("[Button] DTC request queue full - ignored");
+            }
             return true;
 
         case BTN_DTC_UP:
             if (ui_buttons[BTN_DTC_UP].enabled) {
                 scrollDTCUp();
-                page_needs_redraw = true;
+                content_needs_redraw = true;  // Bars unchanged - repaint list only
             }
             return true;
 
         case BTN_DTC_DOWN:
             if (ui_buttons[BTN_DTC_DOWN].enabled) {
                 scrollDTCDown(dtc_count);
-                page_needs_redraw = true;
+                content_needs_redraw = true;  // Bars unchanged - repaint list only
             }
             return true;
 
@@ -426,6 +469,61 @@ inline bool activateButton(Page& current_page, bool& page_needs_redraw, int dtc_
     }
 }
 
+/**
+ * Snapshot of all GPIO input levels (GPIO0-31 low word, GPIO32-39 high word)
+ * Two register reads sample every button at the same instant, instead of
+ * three separate digitalRead() calls through the HAL
+ */
+inline uint64_t readGPIOInputs() {
+    return ((uint64_t)REG_READ(GPIO_IN1_REG) << 32) | REG_READ(GPIO_IN_REG);
+}
+
+#define BUTTON_SAMPLE_COUNT 5      // Snapshots per poll (median-of-5)
+#define BUTTON_SAMPLE_GAP_US 20    // Spacing between snapshots
+
+/**
+ * Median-of-5 GPIO snapshot
+ * Takes five register snapshots and returns the per-bit median (majority),
+ * so a single-sample glitch on a button line can't trigger a press.
+ * Uses a 5-input sorting network where each compare-swap is a bitwise
+ * AND (min) / OR (max), filtering all 40 pins at once without branches.
+ */
+inline uint64_t readGPIOInputsFiltered() {
+    uint64_t s[BUTTON_SAMPLE_COUNT];
+    for (int i = 0; i < BUTTON_SAMPLE_COUNT; i++) {
+        if (i > 0) {
+            delayMicroseconds(BUTTON_SAMPLE_GAP_US);
+        }
+        s[i] = readGPIOInputs();
+    }
+
+    // Sorting network for 5 elements: (0,1)(3,4)(2,4)(2,3)(0,3)(0,2)(1,4)(1,3)(1,2)
+    static const uint8_t network[][2] = {
+        {0, 1}, {3, 4}, {2, 4}, {2, 3}, {0, 3}, {0, 2}, {1, 4}, {1, 3}, {1, 2}
+    };
+    for (const auto& cs : network) {
+        uint64_t lo = s[cs[0]] & s[cs[1]];
+        uint64_t hi = s[cs[0]] | s[cs[1]];
+        s[cs[0]] = lo;
+        s[cs[1]] = hi;
+    }
+
+    return s[BUTTON_SAMPLE_COUNT / 2];
+}
+
+/**
+ * How long the main loop can sleep before the buttons need another look
+ * @return Time left in the debounce window while a press is pending or a
+ *         button is held, else UINT32_MAX (idle - the ISR wakes the loop)
+ */
+inline uint32_t buttonIdleMs() {
+    if (!button_edge_pending && !button_held) {
+        return UINT32_MAX;
+    }
+    uint32_t since = millis() - last_button_time;
+    return (since < DEBOUNCE_DELAY_MS) ? DEBOUNCE_DELAY_MS - since : 0;
+}
+
 /**
  * Handle physical button presses
  * @param current_page Current page reference (may be changed)
@@ -433,29 +531,39 @@ inline bool activateButton(Page& current_page, bool& page_needs_redraw, int dtc_
  * @param dtc_count Current DTC count
  */
 inline void handleButtonInput(Page& current_page, bool& page_needs_redraw, int dtc_count) {
-    static unsigned long last_button_time = 0;
+    // Nothing pressed since the last sample and nothing held down (a held
+    // button auto-repeats) - skip sampling the pins
+    if (!button_edge_pending && !button_held) {
+        return;
+    }
 
-    // Debounce - ignore button presses within 300ms
-    if (millis() - last_button_time < DEBOUNCE_DELAY_MS) {
+    // Debounce - ignore button presses within DEBOUNCE_DELAY_MS
+    // (clock read once per poll and reused for the press timestamp)
+    unsigned long now = millis();
+    if (now - last_button_time < DEBOUNCE_DELAY_MS) {
         return;
     }
 
-    // Check buttons (active LOW with pull-up resistors)
-    bool left_pressed = (digitalRead(BTN_LEFT) == LOW);
-    bool right_pressed = (digitalRead(BTN_RIGHT) == LOW);
-    bool select_pressed = (digitalRead(BTN_SELECT) == LOW);
+    // Check buttons (active LOW with pull-up resistors, glitch-filtered)
+    // Clear the flag first so an edge during sampling isn't lost
+    button_edge_pending = false;
+    uint64_t levels = readGPIOInputsFiltered();
+    bool left_pressed = !(levels & GPIO_BIT(BTN_LEFT));
+    bool right_pressed = !(levels & GPIO_BIT(BTN_RIGHT));
+    bool select_pressed = !(levels & GPIO_BIT(BTN_SELECT));
+    button_held = left_pressed || right_pressed || select_pressed;
+    if (button_held) {
+        last_button_time = now;
+    }
 
     if (left_pressed) {
         navigatePreviousButton(current_page);
-        last_button_time = millis();
     }
     else if (right_pressed) {
         navigateNextButton(current_page);
-        last_button_time = millis();
     }
     else if (select_pressed) {
         activateButton(current_page, page_needs_redraw, dtc_count);
-        last_button_time = millis();
     }
 }
 
@@ -11,24 +11,20 @@
 /**
  * Draw configuration page with 3-section layout
  * Layout: Vehicle Info (top-left), Bluetooth (bottom-left), Display (top-right)
+ * @param vehicle_vin VIN from the caller's OBD data snapshot (empty = not read yet)
  */
-inline void drawConfigPage() {
+inline void drawConfigPage(const char* vehicle_vin) {
     // Left column X position, Right column X position
     const int LEFT_X = 10;
     const int RIGHT_X = 250;
     const int TOP_Y = CONTENT_Y_START + 10;
     const int BOTTOM_Y = CONTENT_Y_START + 130;
 
-    // Get VIN from shared data (with safety check)
-    char vin[18] = "Loading...";
-    if (data_mutex != NULL) {
-        xSemaphoreTake(data_mutex, portMAX_DELAY);
-        if (obd_data.vin[0] != '\0') {
-            strncpy(vin, obd_data.vin, sizeof(vin) - 1);
-            vin[17] = '\0';
-        }
-        xSemaphoreGive(data_mutex);
-    }
+    // VIN comes from the snapshot already taken under the mutex
+    const char* vin = (vehicle_vin[0] != '\0') ? vehicle_vin : "Loading...";
+
+    // Static text page - draw everything in one SPI transaction
+    tft.startWrite();
 
     // ========================================
     // VEHICLE INFO (Top Left)
@@ -89,9 +85,10 @@ inline void drawConfigPage() {
     y += 30;
     tft.drawString("Refresh Rate:", RIGHT_X, y);
     char hz_str[16];
-    // Calculate actual refresh rate from DISPLAY_REFRESH_MS
-    float actual_hz = 1000.0f / DISPLAY_REFRESH_MS;
-    snprintf(hz_str, sizeof(hz_str), "%.1f Hz", actual_hz);
+    // Calculate actual refresh rate from DISPLAY_REFRESH_MS in tenths of Hz,
+    // rounded to nearest (integer math - no float printf)
+    const int hz_tenths = (10000 + DISPLAY_REFRESH_MS / 2) / DISPLAY_REFRESH_MS;
+    snprintf(hz_str, sizeof(hz_str), "%d.%d Hz", hz_tenths / 10, hz_tenths % 10);
     tft.drawString(hz_str, RIGHT_X + 10, y + 12);
 
     y += 30;
@@ -103,6 +100,8 @@ inline void drawConfigPage() {
     y += 30;
     tft.drawString("Controller:", RIGHT_X, y);
     tft.drawString("ILI9488", RIGHT_X + 10, y + 12);
+
+    tft.endWrite();
 }
 
 #endif // CONFIG_PAGE_H
@@ -8,35 +8,25 @@
 #define DASHBOARD_H
 
 #include "ui_common.h"
+#include "../obd2/obd_data.h"
 
 /**
  * Draw dashboard with smart partial updates and boxed layout
- * Only redraws values that have changed to prevent flickering
+ * Only formats the fields flagged in live.dirty, and only redraws values
+ * whose displayed text has changed to prevent flickering (compares against
+ * a cache of the strings currently on screen)
  *
- * @param rpm Current RPM value
- * @param last_rpm Previous RPM value
- * @param speed Current speed (km/h)
- * @param last_speed Previous speed
- * @param coolant Current coolant temp (°C)
- * @param last_coolant Previous coolant temp
- * @param throttle Current throttle position (%)
- * @param last_throttle Previous throttle position
- * @param battery Current battery voltage (V)
- * @param last_battery Previous battery voltage
- * @param intake Current intake temp (°C)
- * @param last_intake Previous intake temp
+ * @param live Current live values (RPM, speed, temps, throttle, battery)
  * @param force_full_redraw Force complete redraw (for page changes)
  */
-inline void drawDashboardPage(uint16_t rpm, uint16_t last_rpm,
-                              uint8_t speed, uint8_t last_speed,
-                              float coolant, float last_coolant,
-                              float throttle, float last_throttle,
-                              float battery, float last_battery,
-                              float intake, float last_intake,
-                              bool force_full_redraw) {
+inline void drawDashboardPage(const OBDLiveData& live, bool force_full_redraw) {
 
     static bool first_draw = true;
 
+    // Text currently shown in each box (one slot per metric)
+    enum { SLOT_RPM, SLOT_SPEED, SLOT_COOLANT, SLOT_THROTTLE, SLOT_BATTERY, SLOT_INTAKE, SLOT_COUNT };
+    static char drawn[SLOT_COUNT][16];
+
     // Reset first_draw if full redraw requested
     if (force_full_redraw) {
         first_draw = true;
@@ -47,15 +37,27 @@ inline void drawDashboardPage(uint16_t rpm, uint16_t last_rpm,
     const int box_width = (SCREEN_WIDTH - 3 * margin) / 2;  // 2 columns
     const int box_height = (CONTENT_HEIGHT - 4 * margin) / 3;  // 3 rows
     const int start_y = CONTENT_Y_START + margin;
+    const int VALUE_AREA_WIDTH = box_width - 10;
+    const int VALUE_AREA_HEIGHT = 28;
+
+    // Off-screen 1-bit buffer for the value area (~780 bytes, allocated once)
+    static TFT_eSprite value_sprite(&tft);
+    if (!value_sprite.created()) {
+        createTextSprite(value_sprite, VALUE_AREA_WIDTH, VALUE_AREA_HEIGHT, 3,
+                         COLOR_WHITE, COLOR_BLACK);
+    }
 
     // Helper function to draw a metric box
     auto drawMetricBox = [&](int col, int row, const char* label, const char* value,
-                             const char* last_value, uint16_t label_color, bool force_redraw) {
+                             int slot, uint16_t label_color, bool force_redraw) {
         int x = margin + col * (box_width + margin);
         int y = start_y + row * (box_height + margin);
 
         // Draw box border and label only on first draw
         if (first_draw || force_redraw) {
+            // Border and label in one SPI transaction (no per-glyph CS toggling)
+            tft.startWrite();
+
             // Box border
             tft.drawRect(x, y, box_width, box_height, COLOR_GRAY);
 
@@ -64,72 +66,85 @@ inline void drawDashboardPage(uint16_t rpm, uint16_t last_rpm,
             tft.setTextSize(2);
             tft.setCursor(x + 10, y + 8);
             tft.print(label);
+
+            tft.endWrite();
         }
 
         // Update value only if changed
-        if (first_draw || force_redraw || strcmp(value, last_value) != 0) {
-            // Clear value area manually (instead of using text padding)
-            int value_y = y + 30;
-            tft.fillRect(x + 5, value_y, box_width - 10, 28, COLOR_BLACK);
-            delay(20);  // Required delay after fillRect
+        if (first_draw || force_redraw || strcmp(value, drawn[slot]) != 0) {
+            strncpy(drawn[slot], value, sizeof(drawn[slot]) - 1);
 
-            // Draw new value (centered) - use simple print API
-            tft.setTextColor(COLOR_WHITE, COLOR_BLACK);
-            tft.setTextSize(3);
+            int value_x = x + 5;
+            int value_y = y + 30;
 
             // Calculate center position for text
-            int text_width = strlen(value) * 18;  // Approximate width for size 3
-            int text_x = x + (box_width - text_width) / 2;
-            if (text_x < x + 5) text_x = x + 5;  // Ensure minimum margin
-
-            tft.setCursor(text_x, value_y);
-            tft.print(value);
+            int text_x = centerTextX(x, box_width, textWidth(value, 3));
+            if (text_x < value_x) text_x = value_x;  // Ensure minimum margin
+
+            if (value_sprite.created()) {
+                // Render clear + text off-screen, then push the whole value
+                // area as one window write (222×28 = 6,216 pixels, paced
+                // like the small fillRect it replaces)
+                pushTextSprite(value_sprite, value_x, value_y, value,
+                               text_x - value_x, FILL_SETTLE_MS);
+            } else {
+                // Fallback: clear value area manually, then print directly
+                fillRectPaced(value_x, value_y, VALUE_AREA_WIDTH, VALUE_AREA_HEIGHT,
+                              COLOR_BLACK, FILL_SETTLE_MS);
+
+                tft.setTextColor(COLOR_WHITE, COLOR_BLACK);
+                tft.setTextSize(3);
+                tft.setCursor(text_x, value_y);
+                tft.print(value);
+            }
         }
-
-        // Reset text settings to prevent corruption
-        tft.setTextColor(COLOR_WHITE, COLOR_BLACK);
-        tft.setTextSize(1);
     };
 
-    // Format values
-    char rpm_val[16], last_rpm_val[16];
-    snprintf(rpm_val, sizeof(rpm_val), "%d", rpm);
-    snprintf(last_rpm_val, sizeof(last_rpm_val), "%d", last_rpm);
-
-    char speed_val[16], last_speed_val[16];
-    snprintf(speed_val, sizeof(speed_val), "%d", speed);
-    snprintf(last_speed_val, sizeof(last_speed_val), "%d", last_speed);
-
-    char coolant_val[16], last_coolant_val[16];
-    snprintf(coolant_val, sizeof(coolant_val), "%.1f", coolant);
-    snprintf(last_coolant_val, sizeof(last_coolant_val), "%.1f", last_coolant);
+    // Only format and draw the fields that changed (everything on first draw)
+    const uint8_t dirty = first_draw ? LIVE_DIRTY_ALL : live.dirty;
+    char value[16];
+    int len;
 
-    char throttle_val[16], last_throttle_val[16];
-    snprintf(throttle_val, sizeof(throttle_val), "%.0f%%", throttle);
-    snprintf(last_throttle_val, sizeof(last_throttle_val), "%.0f%%", last_throttle);
-
-    char battery_val[16], last_battery_val[16];
-    snprintf(battery_val, sizeof(battery_val), "%.1fV", battery);
-    snprintf(last_battery_val, sizeof(last_battery_val), "%.1fV", last_battery);
-
-    char intake_val[16], last_intake_val[16];
-    snprintf(intake_val, sizeof(intake_val), "%.1f", intake);
-    snprintf(last_intake_val, sizeof(last_intake_val), "%.1f", last_intake);
-
-    // Draw all metrics in grid layout (all labels in cyan for consistency)
+    // Draw metrics in grid layout (all labels in cyan for consistency)
     // Row 0: RPM | Speed
-    drawMetricBox(0, 0, "RPM", rpm_val, last_rpm_val, COLOR_CYAN, false);
-    drawMetricBox(1, 0, "Speed (km/h)", speed_val, last_speed_val, COLOR_CYAN, false);
+    if (dirty & LIVE_DIRTY_RPM) {
+        formatInt(value, live.rpm);
+        drawMetricBox(0, 0, "RPM", value, SLOT_RPM, COLOR_CYAN, false);
+    }
+    if (dirty & LIVE_DIRTY_SPEED) {
+        formatInt(value, live.speed);
+        drawMetricBox(1, 0, "Speed (km/h)", value, SLOT_SPEED, COLOR_CYAN, false);
+    }
 
     // Row 1: Coolant | Throttle
-    drawMetricBox(0, 1, "Coolant (C)", coolant_val, last_coolant_val, COLOR_CYAN, false);
-    drawMetricBox(1, 1, "Throttle", throttle_val, last_throttle_val, COLOR_CYAN, false);
+    if (dirty & LIVE_DIRTY_COOLANT) {
+        formatTenths(value, live.coolant_temp);
+        drawMetricBox(0, 1, "Coolant (C)", value, SLOT_COOLANT, COLOR_CYAN, false);
+    }
+    if (dirty & LIVE_DIRTY_THROTTLE) {
+        len = formatInt(value, (int32_t)lroundf(live.throttle));
+        value[len++] = '%';
+        value[len] = '\0';
+        drawMetricBox(1, 1, "Throttle", value, SLOT_THROTTLE, COLOR_CYAN, false);
+    }
 
     // Row 2: Battery | Intake
-    drawMetricBox(0, 2, "Battery", battery_val, last_battery_val, COLOR_CYAN, false);
-    drawMetricBox(1, 2, "Intake (C)", intake_val, last_intake_val, COLOR_CYAN, false);
+    if (dirty & LIVE_DIRTY_BATTERY) {
+        len = formatTenths(value, live.battery_voltage);
+        value[len++] = 'V';
+        value[len] = '\0';
+        drawMetricBox(0, 2, "Battery", value, SLOT_BATTERY, COLOR_CYAN, false);
+    }
+    if (dirty & LIVE_DIRTY_INTAKE) {
+        formatTenths(value, live.intake_temp);
+        drawMetricBox(1, 2, "Intake (C)", value, SLOT_INTAKE, COLOR_CYAN, false);
+    }
+
+    // Reset text settings to prevent corruption (once, not per box)
+    tft.setTextColor(COLOR_WHITE, COLOR_BLACK);
+    tft.setTextSize(1);
 
-    Serial.println("[Dashboard] All boxes drawn");
+    DISPLAY_LOG("[Dashboard] All boxes drawn\n");
 
     first_draw = false;
 }
@@ -10,6 +10,25 @@
 #include "config_page.h"
 #include "button_nav.h"
 
+// ============================================================================
+// SHARED UI STATE (declared in button_nav.h / dtc_page.h)
+// ============================================================================
+
+UIButton ui_buttons[BTN_MAX] = {
+    // Bottom Navigation (always visible on all pages)
+    {BTN_NAV_DASHBOARD, NAV_DASHBOARD_X, BOTTOM_NAV_Y, NAV_BUTTON_WIDTH, BOTTOM_NAV_HEIGHT, true, (Page)99},  // Page 99 = always visible
+    {BTN_NAV_DTC,       NAV_DTC_X,       BOTTOM_NAV_Y, NAV_BUTTON_WIDTH, BOTTOM_NAV_HEIGHT, true, (Page)99},
+    {BTN_NAV_CONFIG,    NAV_CONFIG_X,    BOTTOM_NAV_Y, NAV_BUTTON_WIDTH, BOTTOM_NAV_HEIGHT, true, (Page)99},
+
+    // DTC Page Buttons (only visible on DTC page)
+    {BTN_DTC_REFRESH, DTC_REFRESH_X, DTC_BTN_Y,    DTC_REFRESH_WIDTH, DTC_BTN_HEIGHT,    true,  PAGE_DTC},
+    {BTN_DTC_CLEAR,   DTC_CLEAR_X,   DTC_BTN_Y,    DTC_CLEAR_WIDTH,   DTC_BTN_HEIGHT,    true,  PAGE_DTC},
+    {BTN_DTC_UP,      DTC_UP_X,      DTC_SCROLL_Y, DTC_SCROLL_WIDTH,  DTC_SCROLL_HEIGHT, false, PAGE_DTC},  // Enabled dynamically
+    {BTN_DTC_DOWN,    DTC_DOWN_X,    DTC_SCROLL_Y, DTC_SCROLL_WIDTH,  DTC_SCROLL_HEIGHT, false, PAGE_DTC},  // Enabled dynamically
+};
+
+int dtc_scroll_offset = 0;
+
 // ============================================================================
 // DISPLAY FUNCTIONS
 // ============================================================================
@@ -21,38 +40,37 @@
 void safeFillScreen(uint16_t color) {
     const int strip_height = 10;  // Draw in 10px strips
     for (int y = 0; y < SCREEN_HEIGHT; y += strip_height) {
-        tft.fillRect(0, y, SCREEN_WIDTH, strip_height, color);
-        delay(5);  // Required delay after fillRect
+        fillRectPaced(0, y, SCREEN_WIDTH, strip_height, color, 5);
+    }
+}
+
+/**
+ * Clear the content area between top bar and bottom nav
+ * Uses strips (480×245 is far above the 10k pixel limit)
+ */
+static void clearContentArea() {
+    const int strip_height = 10;
+    for (int y = CONTENT_Y_START; y < BOTTOM_NAV_Y; y += strip_height) {
+        int height = min(strip_height, BOTTOM_NAV_Y - y);
+        fillRectPaced(0, y, SCREEN_WIDTH, height, COLOR_BLACK, STRIP_SETTLE_MS);
     }
 }
 
 void initDisplay() {
-    Serial.println("Initializing display...");
-    Serial.printf("TFT object address: %p\n", &tft);
+    Serial.println("Initializing display...");  // Printed first so a hang in init() is visible
 
     tft.init();
     delay(50);  // Brief time for hardware initialization
-    Serial.println("✓ tft.init() completed");
 
-    Serial.println("Setting rotation...");
     tft.setRotation(SCREEN_ROTATION);
-    Serial.printf("✓ Rotation set to %d\n", SCREEN_ROTATION);
-
-    Serial.println("Clearing screen to BLACK...");
     safeFillScreen(COLOR_BLACK);  // Use safe fill (already has delays)
-    Serial.printf("✓ Screen cleared (COLOR_BLACK = 0x%04X)\n", COLOR_BLACK);
 
-    Serial.println("✓ Display initialized");
+    Serial.printf("✓ Display initialized (rotation %d, screen cleared)\n", SCREEN_ROTATION);
 }
 
 void drawCurrentPage(Page current_page, bool& page_needs_redraw) {
     static int draw_count = 0;
-    static uint16_t last_rpm = 0xFFFF;
-    static uint8_t last_speed = 0xFF;
-    static float last_coolant = -999;
-    static float last_throttle = -999;
-    static float last_battery = -999;
-    static float last_intake = -999;
+    static bool dashboard_full_redraw = true;  // Boxes/labels need repainting
     static bool last_connected = false;
     static uint8_t last_dtc_count = 0;  // Initialize to 0 (matches obd_data initial state)
     static bool needs_full_redraw = true;
@@ -64,15 +82,29 @@ void drawCurrentPage(Page current_page, bool& page_needs_redraw) {
 
     // Debug output every 50 frames
     if (draw_count % 50 == 1) {
-        Serial.printf("[Display] Frame %d, Page=%d, Redraw=%d\n",
-                      draw_count, current_page, page_needs_redraw);
+        DISPLAY_LOG("[Display] Frame %d, Page=%d, Redraw=%d\n",
+                    draw_count, current_page, page_needs_redraw);
     }
 
     // Get data copy (thread-safe)
-    OBDData data_copy;
-    xSemaphoreTake(data_mutex, portMAX_DELAY);
-    data_copy = obd_data;
-    xSemaphoreGive(data_mutex);
+    // Static: the snapshot is reused every frame instead of living on the
+    // loop task's stack (only this function ever touches it)
+    // Never wait for the lock: if the OBD2 task holds it right now (e.g.
+    // copying a DTC list), draw this frame from the previous snapshot and
+    // pick up the change next frame
+    static OBDData data_copy;
+    if (xSemaphoreTake(data_mutex, 0) == pdTRUE) {
+        data_copy = obd_data;
+        xSemaphoreGive(data_mutex);
+    }
+
+    // Drain live PID samples (zero-timeout receive, never waits on the OBD2 task)
+    // Several updates between frames collapse into the newest value per PID
+    static OBDLiveData live_copy = {0};
+    LiveSample sample;
+    while (xQueueReceive(live_sample_queue, &sample, 0) == pdTRUE) {
+        applyLiveSample(live_copy, sample);
+    }
 
     // Update button visibility based on current state
     updateButtonVisibility(current_page, data_copy.dtc_count, getDTCScrollOffset());
@@ -105,17 +137,13 @@ void drawCurrentPage(Page current_page, bool& page_needs_redraw) {
     }
 
     // Determine status color
+    // DTC list is kept sorted by severity (most severe first), so the
+    // first entry alone tells whether any code is critical
     uint16_t status_color = STATUS_OK;
     if (!data_copy.connected) {
         status_color = STATUS_ERROR;
     } else if (data_copy.dtc_count > 0) {
-        bool has_critical = false;
-        for (int i = 0; i < data_copy.dtc_count; i++) {
-            if (data_copy.dtc_codes[i].severity == DTC_SEVERITY_CRITICAL) {
-                has_critical = true;
-                break;
-            }
-        }
+        bool has_critical = (data_copy.dtc_codes[0].severity == DTC_SEVERITY_CRITICAL);
         status_color = has_critical ? STATUS_ERROR : STATUS_WARNING;
     }
 
@@ -126,76 +154,44 @@ void drawCurrentPage(Page current_page, bool& page_needs_redraw) {
 
     // Full redraw if page changed or connection state changed
     if (do_full_redraw) {
-        Serial.println("[Display] Starting full redraw...");
-
-        // Explicitly clear ALL nav button highlights before full redraw
-        // This ensures old highlights don't persist through page changes
-        // We clear all three nav buttons with black to completely remove any highlights
-        Serial.println("[Display] Clearing all button highlights...");
-        for (int i = 0; i < 3; i++) {  // Clear all 3 nav buttons
-            // Clear with BLACK to completely remove highlight, regardless of page state
-            for (int j = 0; j < 2; j++) {
-                int btn_x = i * 160;  // NAV_BUTTON_WIDTH = 160
-                int btn_y = 280;      // BOTTOM_NAV_Y
-                int x = btn_x + j + 1;
-                int y = btn_y + j + 1;
-                int w = 160 - ((j + 1) * 2);
-                int h = 40 - ((j + 1) * 2);
-                if (w > 4 && h > 4) {
-                    tft.drawRect(x, y, w, h, COLOR_BLACK);
-                }
-            }
-        }
+        Serial.printf("[Display] Full redraw (page=%d)\n", current_page);
 
-        // Clear screen first (use safe fill to avoid power spike)
-        Serial.println("[Display] Clearing screen...");
-        safeFillScreen(COLOR_BLACK);
-        Serial.println("[Display] Screen cleared");
+        // Clear content area only - top bar and bottom nav paint their
+        // own backgrounds, so a full-screen fill would just be overdrawn
+        clearContentArea();
+        DISPLAY_LOG("[Display] Content area cleared\n");
 
         // Draw top bar
-        Serial.println("[Display] Drawing top bar...");
         drawTopBar("OBDeck", page_name, status_color, data_copy.dtc_count);
-        Serial.println("[Display] Top bar drawn");
+        DISPLAY_LOG("[Display] Top bar drawn\n");
 
         // Draw bottom navigation
-        Serial.println("[Display] Drawing bottom nav...");
         drawBottomNav(current_page);
-        Serial.println("[Display] Bottom nav drawn");
+        DISPLAY_LOG("[Display] Bottom nav drawn\n");
 
-
-        // Reset DTC scroll when switching to DTC page
-        if (current_page == PAGE_DTC) {
+        // DTC list changed under us - start again from the first entry
+        if (dtc_changed_on_dtc_page) {
             resetDTCScroll();
         }
 
         // Reset flags
         page_needs_redraw = false;
+        content_needs_redraw = false;  // Content is drawn below anyway
         last_connected = data_copy.connected;
         last_dtc_count = data_copy.dtc_count;
         needs_full_redraw = false;
 
         // Force redraw of all values
-        last_rpm = 0xFFFF;
-        last_speed = 0xFF;
-        last_coolant = -999;
-        last_throttle = -999;
-        last_battery = -999;
-        last_intake = -999;
-
-        // Content area already cleared by safeFillScreen above - no need to clear again
-        Serial.println("[Display] Ready to draw page content...");
+        dashboard_full_redraw = true;
+
+        // Content area already cleared above - no need to clear again
     }
     // Handle initial connection without full redraw (just clear error screen area)
     else if (is_initial_connection) {
         Serial.println("[Display] Initial connection - clearing error screen...");
 
         // Clear only the content area (not the entire screen)
-        const int strip_height = 10;
-        for (int y = CONTENT_Y_START; y < SCREEN_HEIGHT - BOTTOM_NAV_HEIGHT; y += strip_height) {
-            int height = min(strip_height, SCREEN_HEIGHT - BOTTOM_NAV_HEIGHT - y);
-            tft.fillRect(0, y, SCREEN_WIDTH, height, COLOR_BLACK);
-            delay(10);  // Required after fillRect
-        }
+        clearContentArea();
 
         // Update top bar only (status color may have changed)
         drawTopBar("OBDeck", page_name, status_color, data_copy.dtc_count);
@@ -227,13 +223,12 @@ void drawCurrentPage(Page current_page, bool& page_needs_redraw) {
             // Red box background - USE STRIPS to avoid power spike!
             const int strip_height = 10;
             for (int y_offset = 0; y_offset < 120; y_offset += strip_height) {
-                tft.fillRect(50, center_y + y_offset, SCREEN_WIDTH - 100, strip_height, COLOR_DARKGRAY);
-                delay(10);  // Required delay after fillRect
+                fillRectPaced(50, center_y + y_offset, SCREEN_WIDTH - 100, strip_height,
+                              COLOR_DARKGRAY, STRIP_SETTLE_MS);
             }
 
-            // Draw borders
-            tft.drawRect(50, center_y, SCREEN_WIDTH - 100, 120, COLOR_WHITE);
-            tft.drawRect(51, center_y + 1, SCREEN_WIDTH - 102, 118, COLOR_WHITE);
+            // Draw 2px border (one frame instead of two nested drawRects)
+            drawFrame(50, center_y, SCREEN_WIDTH - 100, 120, 2, COLOR_WHITE);
 
             // "Connecting" text
             tft.setTextColor(COLOR_WHITE, COLOR_DARKGRAY);
@@ -260,23 +255,29 @@ void drawCurrentPage(Page current_page, bool& page_needs_redraw) {
         // Animate "Reconnecting" with dots (updates every frame)
         animation_state = (animation_state + 1) % 4;
 
-        // Build dots string
-        char dots[5] = "";
-        for (int i = 0; i < animation_state; i++) {
-            dots[i] = '.';
+        // Fixed-width frames: trailing spaces are drawn opaquely in the
+        // background color, erasing old dots without a padding fillRect
+        static const char* const dot_frames[4] = {"   ", ".  ", ".. ", "..."};
+
+        // Draw animated dots every frame - via a small 1-bit sprite
+        // (36×16 = 576 pixels, one window write instead of per-dot fills)
+        static TFT_eSprite dots_sprite(&tft);
+        if (!dots_sprite.created()) {
+            createTextSprite(dots_sprite, textWidth("...", 2), GLCD_CHAR_HEIGHT * 2, 2,
+                             COLOR_WHITE, COLOR_DARKGRAY);
         }
-        dots[animation_state] = '\0';
 
-        // Draw animated dots - use drawString instead of print
-        tft.setTextColor(COLOR_WHITE, COLOR_DARKGRAY);
-        tft.setTextSize(2);
-        tft.setTextDatum(TL_DATUM);
-        tft.setTextPadding(100);  // Clear old dots automatically
-        tft.drawString(dots, 220, center_y + 80);
-        delay(20);  // Required delay after drawString with padding (uses fillRect internally)
+        if (dots_sprite.created()) {
+            pushTextSprite(dots_sprite, 220, center_y + 80, dot_frames[animation_state], 0, 0);
+        } else {
+            // GLCD glyphs with bg color write every pixel
+            tft.setTextColor(COLOR_WHITE, COLOR_DARKGRAY);
+            tft.setTextSize(2);
+            tft.setCursor(220, center_y + 80);
+            tft.print(dot_frames[animation_state]);
+        }
 
         // Reset text settings after animation
-        tft.setTextPadding(0);
         tft.setTextColor(COLOR_WHITE, COLOR_BLACK);
         tft.setTextSize(1);
     } else {
@@ -285,44 +286,40 @@ void drawCurrentPage(Page current_page, bool& page_needs_redraw) {
 
         // Draw page content based on current page
         if (current_page == PAGE_DASHBOARD) {
-            Serial.println("[Display] >>> STEP 5: Drawing dashboard page...");
-            bool is_full_redraw = (last_rpm == 0xFFFF);
-            drawDashboardPage(
-                data_copy.rpm, last_rpm,
-                data_copy.speed, last_speed,
-                data_copy.coolant_temp, last_coolant,
-                data_copy.throttle, last_throttle,
-                data_copy.battery_voltage, last_battery,
-                data_copy.intake_temp, last_intake,
-                is_full_redraw
-            );
-
-            Serial.println("[Display] Dashboard page drawn OK");
-
-            last_rpm = data_copy.rpm;
-            last_speed = data_copy.speed;
-            last_coolant = data_copy.coolant_temp;
-            last_throttle = data_copy.throttle;
-            last_battery = data_copy.battery_voltage;
-            last_intake = data_copy.intake_temp;
+            // Nothing to repaint if no live value changed since the last draw
+            if (dashboard_full_redraw || live_copy.dirty != 0) {
+                drawDashboardPage(live_copy, dashboard_full_redraw);
+
+                DISPLAY_LOG("[Display] Dashboard page drawn\n");
+
+                dashboard_full_redraw = false;
+                live_copy.dirty = 0;
+            }
         } else if (current_page == PAGE_DTC) {
             if (do_full_redraw) {
                 // Already cleared above, just draw page
                 drawDTCPage(data_copy.dtc_codes, data_copy.dtc_count);
+            } else if (content_needs_redraw) {
+                // Scroll: only the list changed - top bar and nav stay as they are
+                clearContentArea();
+                drawDTCPage(data_copy.dtc_codes, data_copy.dtc_count);
+                refreshButtonHighlight(current_page);
             }
         } else if (current_page == PAGE_CONFIG) {
             // Config page is static - only draw on page change
             if (do_full_redraw) {
                 // Already cleared above, just draw page
-                drawConfigPage();
+                drawConfigPage(data_copy.vin);
             }
         }
     }
 
+    content_needs_redraw = false;
+
     // Redraw button highlight (only on full redraw to avoid text buffer issues)
     if (do_full_redraw) {
-        Serial.printf("[Display] Refreshing button highlight: button_index=%d, page=%d\n",
-                      current_button_index, current_page);
+        DISPLAY_LOG("[Display] Refreshing button highlight: button_index=%d, page=%d\n",
+                    current_button_index, current_page);
         refreshButtonHighlight(current_page);
     }
 }
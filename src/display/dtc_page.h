@@ -9,10 +9,15 @@
 #include "ui_common.h"
 #include "../obd2/obd_data.h"
 
-// Scroll state
-static int dtc_scroll_offset = 0;
+// Scroll state (declared here, defined once in display_manager.cpp so the
+// button handlers and the page renderer share one offset)
+extern int dtc_scroll_offset;
 const int DTC_ITEMS_PER_PAGE = 4;  // Show 4 DTCs (more space for buttons)
 
+// Severity style lookup (indexed by DTC_SEVERITY_INFO/WARNING/CRITICAL)
+static const uint16_t DTC_SEVERITY_COLORS[] = {COLOR_CYAN, COLOR_YELLOW, COLOR_RED};
+static const char* const DTC_SEVERITY_BADGES[] = {"[INFO]", "[WARN]", "[CRIT]"};
+
 /**
  * Get current DTC scroll offset
  */
@@ -32,6 +37,7 @@ inline void drawDTCPage(const DTC* dtc_data, int dtc_count) {
         // No codes - all clear (centered)
         int center_y = CONTENT_Y_START + (CONTENT_HEIGHT / 2) - 60;
 
+        tft.startWrite();
         tft.setTextColor(COLOR_GREEN, COLOR_BLACK);
         tft.setTextSize(4);
         tft.setCursor(100, center_y);
@@ -41,18 +47,21 @@ inline void drawDTCPage(const DTC* dtc_data, int dtc_count) {
         tft.setTextSize(2);
         tft.setCursor(80, center_y + 50);
         tft.print("No trouble codes found");
+        tft.endWrite();
 
         // Refresh button (same position as when DTCs exist - top right)
-        int btn_y = CONTENT_Y_START + 3;
-        tft.fillRect(290, btn_y, 90, 26, COLOR_BLUE);
-        tft.drawRect(290, btn_y, 90, 26, COLOR_WHITE);
+        fillRectPaced(DTC_REFRESH_X, DTC_BTN_Y, DTC_REFRESH_WIDTH, DTC_BTN_HEIGHT, COLOR_BLUE, FILL_SETTLE_MS);
+        tft.startWrite();
+        tft.drawRect(DTC_REFRESH_X, DTC_BTN_Y, DTC_REFRESH_WIDTH, DTC_BTN_HEIGHT, COLOR_WHITE);
         tft.setTextColor(COLOR_WHITE, COLOR_BLUE);
         tft.setTextSize(2);
-        tft.setCursor(295, btn_y + 5);
+        tft.setCursor(DTC_REFRESH_X + 5, DTC_BTN_Y + 5);
         tft.print("REFRESH");
+        tft.endWrite();
 
     } else {
         // Compact header with count and pagination
+        tft.startWrite();
         tft.setTextColor(COLOR_CYAN, COLOR_BLACK);
         tft.setTextSize(1);
         tft.setCursor(10, y);
@@ -60,31 +69,44 @@ inline void drawDTCPage(const DTC* dtc_data, int dtc_count) {
         int total_pages = (dtc_count + DTC_ITEMS_PER_PAGE - 1) / DTC_ITEMS_PER_PAGE;
         int current_page = (dtc_scroll_offset / DTC_ITEMS_PER_PAGE) + 1;
 
-        tft.printf("%d DTC(s) Found | Page %d/%d", dtc_count, current_page, total_pages);
-
-        // Action buttons (top right) - adjusted positions to fit on screen
-        int btn_y = y - 2;
-
-        // Refresh button (moved left to x=290, width=90)
-        tft.fillRect(290, btn_y, 90, 26, COLOR_BLUE);
-        tft.drawRect(290, btn_y, 90, 26, COLOR_WHITE);
+        // "<n> DTC(s) Found | Page <p>/<total>" without printf
+        char header[48];
+        int len = formatInt(header, dtc_count);
+        len += copyText(header + len, " DTC(s) Found | Page ");
+        len += formatInt(header + len, current_page);
+        header[len++] = '/';
+        formatInt(header + len, total_pages);
+        tft.print(header);
+        tft.endWrite();
+
+        // Action buttons (top right)
+        // Refresh button
+        fillRectPaced(DTC_REFRESH_X, DTC_BTN_Y, DTC_REFRESH_WIDTH, DTC_BTN_HEIGHT, COLOR_BLUE, FILL_SETTLE_MS);
+        tft.startWrite();
+        tft.drawRect(DTC_REFRESH_X, DTC_BTN_Y, DTC_REFRESH_WIDTH, DTC_BTN_HEIGHT, COLOR_WHITE);
         tft.setTextColor(COLOR_WHITE, COLOR_BLUE);
         tft.setTextSize(2);
-        tft.setCursor(295, btn_y + 5);
+        tft.setCursor(DTC_REFRESH_X + 5, DTC_BTN_Y + 5);
         tft.print("REFRESH");
+        tft.endWrite();
 
-        // Clear All button (moved left to x=390, width=85, red)
-        tft.fillRect(390, btn_y, 85, 26, COLOR_RED);
-        tft.drawRect(390, btn_y, 85, 26, COLOR_WHITE);
+        // Clear All button (red)
+        fillRectPaced(DTC_CLEAR_X, DTC_BTN_Y, DTC_CLEAR_WIDTH, DTC_BTN_HEIGHT, COLOR_RED, FILL_SETTLE_MS);
+        tft.startWrite();
+        tft.drawRect(DTC_CLEAR_X, DTC_BTN_Y, DTC_CLEAR_WIDTH, DTC_BTN_HEIGHT, COLOR_WHITE);
         tft.setTextColor(COLOR_WHITE, COLOR_RED);
         tft.setTextSize(2);
-        tft.setCursor(398, btn_y + 5);
+        tft.setCursor(DTC_CLEAR_X + 8, DTC_BTN_Y + 5);
         tft.print("CLEAR");
+        tft.endWrite();
 
         y += 25;
 
+        // Separator and the whole DTC list contain no fills - one SPI transaction
+        tft.startWrite();
+
         // Separator line
-        tft.drawLine(5, y, SCREEN_WIDTH - 5, y, COLOR_GRAY);
+        tft.drawFastHLine(5, y, SCREEN_WIDTH - 9, COLOR_GRAY);
         y += 5;
 
         // Display DTCs (with scrolling)
@@ -93,23 +115,10 @@ inline void drawDTCPage(const DTC* dtc_data, int dtc_count) {
         for (int i = dtc_scroll_offset; i < end_index; i++) {
             const DTC& dtc = dtc_data[i];
 
-            // Determine color based on severity
-            uint16_t severity_color;
-            const char* severity_badge;
-            switch (dtc.severity) {
-                case DTC_SEVERITY_CRITICAL:
-                    severity_color = COLOR_RED;
-                    severity_badge = "CRIT";
-                    break;
-                case DTC_SEVERITY_WARNING:
-                    severity_color = COLOR_YELLOW;
-                    severity_badge = "WARN";
-                    break;
-                default:
-                    severity_color = COLOR_CYAN;
-                    severity_badge = "INFO";
-                    break;
-            }
+            // Determine color and badge based on severity (unknown -> INFO)
+            uint8_t sev = (dtc.severity <= DTC_SEVERITY_CRITICAL) ? dtc.severity : DTC_SEVERITY_INFO;
+            uint16_t severity_color = DTC_SEVERITY_COLORS[sev];
+            const char* severity_badge = DTC_SEVERITY_BADGES[sev];
 
             // DTC code and severity badge
             tft.setTextColor(severity_color, COLOR_BLACK);
@@ -120,7 +129,7 @@ inline void drawDTCPage(const DTC* dtc_data, int dtc_count) {
             tft.setTextColor(COLOR_WHITE, COLOR_BLACK);
             tft.setTextSize(1);
             tft.setCursor(85, y + 5);
-            tft.printf("[%s]", severity_badge);
+            tft.print(severity_badge);
 
             y += 22;
 
@@ -129,55 +138,61 @@ inline void drawDTCPage(const DTC* dtc_data, int dtc_count) {
             tft.setTextSize(1);
             tft.setCursor(10, y);
 
-            // Truncate description if too long
-            char desc_truncated[55];
-            strncpy(desc_truncated, dtc.description, 54);
-            desc_truncated[54] = '\0';
-            tft.print(desc_truncated);
+            // Truncate description if too long (write a bounded span, no copy)
+            const size_t DESC_MAX_CHARS = 54;
+            tft.write((const uint8_t*)dtc.description, strnlen(dtc.description, DESC_MAX_CHARS));
 
             y += 13;
 
             // Separator
-            tft.drawLine(5, y, SCREEN_WIDTH - 5, y, COLOR_DARKGRAY);
+            tft.drawFastHLine(5, y, SCREEN_WIDTH - 9, COLOR_DARKGRAY);
             y += 5;
         }
 
+        tft.endWrite();
+
         // Scroll buttons at bottom if needed
         if (dtc_count > DTC_ITEMS_PER_PAGE) {
-            int button_y = BOTTOM_NAV_Y - 48;
-
             // Up button
             if (dtc_scroll_offset > 0) {
-                tft.fillRect(80, button_y, 140, 38, COLOR_BLUE);
-                tft.drawRect(80, button_y, 140, 38, COLOR_WHITE);
+                fillRectPaced(DTC_UP_X, DTC_SCROLL_Y, DTC_SCROLL_WIDTH, DTC_SCROLL_HEIGHT, COLOR_BLUE, FILL_SETTLE_MS);
+                tft.startWrite();
+                tft.drawRect(DTC_UP_X, DTC_SCROLL_Y, DTC_SCROLL_WIDTH, DTC_SCROLL_HEIGHT, COLOR_WHITE);
                 tft.setTextColor(COLOR_WHITE, COLOR_BLUE);
                 tft.setTextSize(2);
-                tft.setCursor(102, button_y + 11);
+                tft.setCursor(DTC_UP_X + 22, DTC_SCROLL_Y + 11);
                 tft.print("^ UP ^");
+                tft.endWrite();
             } else {
-                tft.fillRect(80, button_y, 140, 38, COLOR_DARKGRAY);
-                tft.drawRect(80, button_y, 140, 38, COLOR_GRAY);
+                fillRectPaced(DTC_UP_X, DTC_SCROLL_Y, DTC_SCROLL_WIDTH, DTC_SCROLL_HEIGHT, COLOR_DARKGRAY, FILL_SETTLE_MS);
+                tft.startWrite();
+                tft.drawRect(DTC_UP_X, DTC_SCROLL_Y, DTC_SCROLL_WIDTH, DTC_SCROLL_HEIGHT, COLOR_GRAY);
                 tft.setTextColor(COLOR_GRAY, COLOR_DARKGRAY);
                 tft.setTextSize(2);
-                tft.setCursor(102, button_y + 11);
+                tft.setCursor(DTC_UP_X + 22, DTC_SCROLL_Y + 11);
                 tft.print("^ UP ^");
+                tft.endWrite();
             }
 
             // Down button
             if (dtc_scroll_offset + DTC_ITEMS_PER_PAGE < dtc_count) {
-                tft.fillRect(260, button_y, 140, 38, COLOR_BLUE);
-                tft.drawRect(260, button_y, 140, 38, COLOR_WHITE);
+                fillRectPaced(DTC_DOWN_X, DTC_SCROLL_Y, DTC_SCROLL_WIDTH, DTC_SCROLL_HEIGHT, COLOR_BLUE, FILL_SETTLE_MS);
+                tft.startWrite();
+                tft.drawRect(DTC_DOWN_X, DTC_SCROLL_Y, DTC_SCROLL_WIDTH, DTC_SCROLL_HEIGHT, COLOR_WHITE);
                 tft.setTextColor(COLOR_WHITE, COLOR_BLUE);
                 tft.setTextSize(2);
-                tft.setCursor(272, button_y + 11);
+                tft.setCursor(DTC_DOWN_X + 12, DTC_SCROLL_Y + 11);
                 tft.print("v DOWN v");
+                tft.endWrite();
             } else {
-                tft.fillRect(260, button_y, 140, 38, COLOR_DARKGRAY);
-                tft.drawRect(260, button_y, 140, 38, COLOR_GRAY);
+                fillRectPaced(DTC_DOWN_X, DTC_SCROLL_Y, DTC_SCROLL_WIDTH, DTC_SCROLL_HEIGHT, COLOR_DARKGRAY, FILL_SETTLE_MS);
+                tft.startWrite();
+                tft.drawRect(DTC_DOWN_X, DTC_SCROLL_Y, DTC_SCROLL_WIDTH, DTC_SCROLL_HEIGHT, COLOR_GRAY);
                 tft.setTextColor(COLOR_GRAY, COLOR_DARKGRAY);
                 tft.setTextSize(2);
-                tft.setCursor(272, button_y + 11);
+                tft.setCursor(DTC_DOWN_X + 12, DTC_SCROLL_Y + 11);
                 tft.print("v DOWN v");
+                tft.endWrite();
             }
         }
     }
@@ -13,6 +13,8 @@
 
 /**
  * Draw top bar with vehicle name, page name, and status
+ * Skipped when the bar already shows exactly this content (nothing else
+ * draws over the top bar, so the last drawn state is what's on screen)
  * @param vehicle_name Name to display on left
  * @param page_name Current page name (center)
  * @param status_color Status indicator color (green/yellow/red)
@@ -20,13 +22,35 @@
  */
 inline void drawTopBar(const char* vehicle_name, const char* page_name,
                        uint16_t status_color, int dtc_count) {
-    // Background - USE STRIPS for large area (480×40 = 19,200 pixels > 10k limit)
+    // Last drawn header state (empty names = never drawn)
+    static char drawn_vehicle[24] = "";
+    static char drawn_page[24] = "";
+    static uint16_t drawn_status_color = 0;
+    static int drawn_dtc_count = -1;
+
+    if (dtc_count == drawn_dtc_count &&
+        status_color == drawn_status_color &&
+        strcmp(page_name, drawn_page) == 0 &&
+        strcmp(vehicle_name, drawn_vehicle) == 0) {
+        return;
+    }
+
+    strncpy(drawn_vehicle, vehicle_name, sizeof(drawn_vehicle) - 1);
+    strncpy(drawn_page, page_name, sizeof(drawn_page) - 1);
+    drawn_status_color = status_color;
+    drawn_dtc_count = dtc_count;
+
+    // Background - USE STRIPS for large area (480×35 = 16,800 pixels > 10k limit)
+    // Last strip is clamped so it doesn't spill into the content area
     const int strip_height = 10;
     for (int y = 0; y < TOP_BAR_HEIGHT; y += strip_height) {
-        tft.fillRect(0, y, SCREEN_WIDTH, strip_height, COLOR_DARKGRAY);
-        delay(10);  // Required delay after fillRect
+        int height = min(strip_height, TOP_BAR_HEIGHT - y);
+        fillRectPaced(0, y, SCREEN_WIDTH, height, COLOR_DARKGRAY, STRIP_SETTLE_MS);
     }
 
+    // Text and indicator in one SPI transaction (no per-glyph CS toggling)
+    tft.startWrite();
+
     // Vehicle name (left)
     tft.setTextColor(COLOR_WHITE, COLOR_DARKGRAY);
     tft.setTextSize(2);
@@ -35,8 +59,7 @@ inline void drawTopBar(const char* vehicle_name, const char* page_name,
 
     // Page name (center)
     tft.setTextColor(COLOR_CYAN, COLOR_DARKGRAY);
-    int page_name_width = strlen(page_name) * 12;
-    tft.setCursor((SCREEN_WIDTH - page_name_width) / 2, 10);
+    tft.setCursor(centerTextX(0, SCREEN_WIDTH, textWidth(page_name, 2)), 10);
     tft.print(page_name);
 
     // Status indicator (right)
@@ -46,23 +69,42 @@ inline void drawTopBar(const char* vehicle_name, const char* page_name,
     // DTC count
     if (dtc_count > 0) {
         char dtc_text[16];
-        snprintf(dtc_text, sizeof(dtc_text), "%d DTC", dtc_count);
+        int len = formatInt(dtc_text, dtc_count);
+        copyText(dtc_text + len, " DTC");
         tft.setTextColor(COLOR_WHITE, COLOR_DARKGRAY);
         tft.setTextSize(1);
         tft.setCursor(status_x + 15, 12);
         tft.print(dtc_text);
     }
+
+    tft.endWrite();
 }
 
 // ============================================================================
 // BOTTOM NAVIGATION
 // ============================================================================
 
+struct NavLabel {
+    const char* text;
+    int16_t text_x;       // Precomputed centered cursor X
+};
+
+// Label positions are fixed - compute them once at compile time
+static constexpr int NAV_LABEL_Y = centerTextY(BOTTOM_NAV_Y, BOTTOM_NAV_HEIGHT, 2);
+static const NavLabel nav_labels[PAGE_COUNT] = {
+    {"Dashboard", centerTextX(NAV_DASHBOARD_X, NAV_BUTTON_WIDTH, textWidth("Dashboard", 2))},
+    {"DTC",       centerTextX(NAV_DTC_X,       NAV_BUTTON_WIDTH, textWidth("DTC", 2))},
+    {"Config",    centerTextX(NAV_CONFIG_X,    NAV_BUTTON_WIDTH, textWidth("Config", 2))},
+};
+
 /**
  * Draw bottom navigation bar with 3 buttons
+ * Only buttons whose active state changed since the last call are repainted
+ * (the nav bar lies outside the content area, so nothing else overdraws it)
  * @param active_page Currently active page (highlighted)
  */
 inline void drawBottomNav(Page active_page) {
+    static int drawn_active = -1;  // -1 = nothing drawn yet (paint all)
     int y = BOTTOM_NAV_Y;
 
     // Draw buttons
@@ -70,10 +112,17 @@ inline void drawBottomNav(Page active_page) {
         int x = i * NAV_BUTTON_WIDTH;
         bool is_active = (i == active_page);
 
+        // Skip buttons that are already on screen in the right state
+        if (drawn_active >= 0 && is_active == (i == drawn_active)) {
+            continue;
+        }
+
         // Button background (each button is 160×40 = 6,400 pixels)
         uint16_t bg_color = is_active ? COLOR_GRAY : COLOR_DARKGRAY;
-        tft.fillRect(x, y, NAV_BUTTON_WIDTH, BOTTOM_NAV_HEIGHT, bg_color);
-        delay(20);  // Required delay after fillRect
+        fillRectPaced(x, y, NAV_BUTTON_WIDTH, BOTTOM_NAV_HEIGHT, bg_color, FILL_SETTLE_MS);
+
+        // Border and label in one SPI transaction
+        tft.startWrite();
 
         // Button border
         tft.drawRect(x, y, NAV_BUTTON_WIDTH, BOTTOM_NAV_HEIGHT, COLOR_GRAY);
@@ -82,27 +131,13 @@ inline void drawBottomNav(Page active_page) {
         tft.setTextColor(COLOR_WHITE, bg_color);
         tft.setTextSize(2);
 
-        const char* label;
-        int text_x;
-
-        switch(i) {
-            case 0:
-                label = "Dashboard";
-                text_x = x + 15;
-                break;
-            case 1:
-                label = "DTC";
-                text_x = x + 50;
-                break;
-            case 2:
-                label = "Config";
-                text_x = x + 30;
-                break;
-        }
+        tft.setCursor(nav_labels[i].text_x, NAV_LABEL_Y);
+        tft.print(nav_labels[i].text);
 
-        tft.setCursor(text_x, y + 12);
-        tft.print(label);
+        tft.endWrite();
     }
+
+    drawn_active = active_page;
 }
 
 #endif // NAV_BAR_H
@@ -8,10 +8,7 @@
 #define STARTUP_SCREEN_H
 
 #include <TFT_eSPI.h>
-#include "ui_common.h"
-
-// External display object
-extern TFT_eSPI tft;
+#include "ui_common.h"  // Also declares the shared tft object
 
 /**
  * Show animated startup screen
@@ -72,16 +69,16 @@ void showStartupScreen() {
             int y = SCAN_START_Y + (step * (SCAN_END_Y - SCAN_START_Y) / SCAN_STEPS);
 
             // Draw scanning line with gradient effect (3 lines for thickness)
-            tft.drawLine(45, y - 1, SCREEN_WIDTH - 45, y - 1, COLOR_GRAY);
-            tft.drawLine(45, y, SCREEN_WIDTH - 45, y, COLOR_CYAN);      // Main bright line
-            tft.drawLine(45, y + 1, SCREEN_WIDTH - 45, y + 1, COLOR_GRAY);
+            tft.drawFastHLine(45, y - 1, SCREEN_WIDTH - 89, COLOR_GRAY);
+            tft.drawFastHLine(45, y, SCREEN_WIDTH - 89, COLOR_CYAN);      // Main bright line
+            tft.drawFastHLine(45, y + 1, SCREEN_WIDTH - 89, COLOR_GRAY);
 
             // Erase previous line (draw black line behind)
             if (step > 2) {
                 int prev_y = SCAN_START_Y + ((step - 3) * (SCAN_END_Y - SCAN_START_Y) / SCAN_STEPS);
-                tft.drawLine(45, prev_y - 1, SCREEN_WIDTH - 45, prev_y - 1, COLOR_BLACK);
-                tft.drawLine(45, prev_y, SCREEN_WIDTH - 45, prev_y, COLOR_BLACK);
-                tft.drawLine(45, prev_y + 1, SCREEN_WIDTH - 45, prev_y + 1, COLOR_BLACK);
+                tft.drawFastHLine(45, prev_y - 1, SCREEN_WIDTH - 89, COLOR_BLACK);
+                tft.drawFastHLine(45, prev_y, SCREEN_WIDTH - 89, COLOR_BLACK);
+                tft.drawFastHLine(45, prev_y + 1, SCREEN_WIDTH - 89, COLOR_BLACK);
             }
 
             delay(SCAN_DELAY);
@@ -89,9 +86,9 @@ void showStartupScreen() {
 
         // Clear last line at end of scan
         int last_y = SCAN_END_Y;
-        tft.drawLine(45, last_y - 1, SCREEN_WIDTH - 45, last_y - 1, COLOR_BLACK);
-        tft.drawLine(45, last_y, SCREEN_WIDTH - 45, last_y, COLOR_BLACK);
-        tft.drawLine(45, last_y + 1, SCREEN_WIDTH - 45, last_y + 1, COLOR_BLACK);
+        tft.drawFastHLine(45, last_y - 1, SCREEN_WIDTH - 89, COLOR_BLACK);
+        tft.drawFastHLine(45, last_y, SCREEN_WIDTH - 89, COLOR_BLACK);
+        tft.drawFastHLine(45, last_y + 1, SCREEN_WIDTH - 89, COLOR_BLACK);
 
         delay(50);  // Brief pause between scans
     }
@@ -8,6 +8,14 @@
 #include <TFT_eSPI.h>
 #include "config.h"  // PlatformIO automatically includes the include/ directory
 
+// Render tracing - compiled out unless DEBUG_DISPLAY is set
+// (Serial writes in the frame path stall rendering at 115200 baud)
+#if DEBUG_DISPLAY
+#define DISPLAY_LOG(...) Serial.printf(__VA_ARGS__)
+#else
+#define DISPLAY_LOG(...) do {} while (0)
+#endif
+
 // ============================================================================
 // PAGE SYSTEM
 // ============================================================================
@@ -35,11 +43,129 @@ enum Page {
 #define NAV_DTC_X           NAV_BUTTON_WIDTH
 #define NAV_CONFIG_X        (NAV_BUTTON_WIDTH * 2)
 
+// DTC Page Action Buttons (top right of content area)
+#define DTC_BTN_Y           (CONTENT_Y_START + 3)
+#define DTC_BTN_HEIGHT      26
+#define DTC_REFRESH_X       290
+#define DTC_REFRESH_WIDTH   90
+#define DTC_CLEAR_X         390
+#define DTC_CLEAR_WIDTH     85
+
+// DTC Page Scroll Buttons (just above bottom navigation)
+#define DTC_SCROLL_Y        (BOTTOM_NAV_Y - 48)
+#define DTC_SCROLL_WIDTH    140
+#define DTC_SCROLL_HEIGHT   38
+#define DTC_UP_X            80
+#define DTC_DOWN_X          260
+
 // Colors for status indicator
 #define STATUS_OK           COLOR_GREEN
 #define STATUS_WARNING      COLOR_YELLOW
 #define STATUS_ERROR        COLOR_RED
 
+// Built-in GLCD font metrics (per character at text size 1)
+#define GLCD_CHAR_WIDTH     6
+#define GLCD_CHAR_HEIGHT    8
+
+// ============================================================================
+// TEXT LAYOUT HELPERS
+// ============================================================================
+
+/**
+ * Compile-time string length (lets static label tables be precomputed)
+ */
+constexpr int constStrLen(const char* text) {
+    return *text ? 1 + constStrLen(text + 1) : 0;
+}
+
+/**
+ * Pixel width of a GLCD string at the given text size
+ */
+constexpr int textWidth(const char* text, uint8_t size) {
+    return constStrLen(text) * GLCD_CHAR_WIDTH * size;
+}
+
+/**
+ * Left edge that centers text of width text_w inside [x, x + w)
+ */
+constexpr int centerTextX(int x, int w, int text_w) {
+    return x + ((w - text_w) >> 1);
+}
+
+/**
+ * Top edge that centers a GLCD text line of the given size inside [y, y + h)
+ */
+constexpr int centerTextY(int y, int h, uint8_t size) {
+    return y + ((h - GLCD_CHAR_HEIGHT * size) >> 1);
+}
+
+// ============================================================================
+// VALUE FORMATTING
+// ============================================================================
+// Integer-only replacements for snprintf("%d") / snprintf("%.1f"): no
+// format-string parsing and no float printf path when drawing text.
+
+/**
+ * Write a decimal integer into out (needs 12 bytes)
+ * @return Number of characters written (excluding terminator)
+ */
+inline int formatInt(char* out, int32_t value) {
+    char digits[10];
+    int n = 0;
+    int len = 0;
+    uint32_t u = (uint32_t)value;
+
+    if (value < 0) {
+        out[len++] = '-';
+        u = 0u - u;
+    }
+    do {
+        digits[n++] = '0' + (u % 10);
+        u /= 10;
+    } while (u > 0);
+
+    while (n > 0) {
+        out[len++] = digits[--n];
+    }
+    out[len] = '\0';
+    return len;
+}
+
+/**
+ * Write value rounded to one decimal place (e.g. "-12.5") into out
+ * @return Number of characters written (excluding terminator)
+ */
+inline int formatTenths(char* out, float value) {
+    int32_t tenths = (int32_t)lroundf(value * 10.0f);
+    int len = 0;
+
+    if (tenths < 0) {
+        out[len++] = '-';  // Also covers -0.x, where the integer part is 0
+        tenths = -tenths;
+    }
+    len += formatInt(out + len, tenths / 10);
+    out[len++] = '.';
+    out[len++] = '0' + (tenths % 10);
+    out[len] = '\0';
+    return len;
+}
+
+/**
+ * Copy a string into out (like strcpy, but returns the length)
+ * Lets fixed messages and formatted numbers be chained into one buffer:
+ * len += copyText(out + len, "...")
+ * @return Number of characters written (excluding terminator)
+ */
+inline int copyText(char* out, const char* text) {
+    int len = 0;
+    while (text[len] != '\0') {
+        out[len] = text[len];
+        len++;
+    }
+    out[len] = '\0';
+    return len;
+}
+
 // ============================================================================
 // GLOBAL OBJECTS
 // ============================================================================
@@ -47,5 +173,125 @@ enum Page {
 extern TFT_eSPI tft;
 extern Page current_page;
 extern bool page_needs_redraw;
+extern bool content_needs_redraw;  // Repaint content area only (bars stay intact)
+
+// ============================================================================
+// FILL PACING
+// ============================================================================
+
+#define FILL_SETTLE_MS      20     // Recovery after a small (6-7k pixel) fill
+#define STRIP_SETTLE_MS     10     // Recovery after a 10px strip of a large fill
+
+// Fills are synchronous: TFT_eSPI has no DMA path for the 18-bit ILI9488,
+// so the CPU streams every pixel. Settle waits use delay(), which blocks
+// only this loop task on Core 1 - the OBD2 task on Core 0 keeps running.
+
+struct FillPacer {
+    uint32_t last_fill_ms;
+    uint32_t pending_settle_ms;
+};
+
+// Single pacing state shared by every bulk pixel write (fills and sprite pushes)
+inline FillPacer& fillPacer() {
+    static FillPacer pacer = {0, 0};
+    return pacer;
+}
+
+/**
+ * Wait out whatever is left of the previous bulk write's settle time
+ * Call before any block write of many pixels (fillRect, pushSprite)
+ */
+inline void beginPacedFill() {
+    FillPacer& pacer = fillPacer();
+    uint32_t elapsed = millis() - pacer.last_fill_ms;
+    if (elapsed < pacer.pending_settle_ms) {
+        delay(pacer.pending_settle_ms - elapsed);
+    }
+}
+
+/**
+ * Record a finished bulk write and the recovery time it requires
+ * @param settle_ms Recovery time required before the next bulk write
+ */
+inline void endPacedFill(uint32_t settle_ms) {
+    FillPacer& pacer = fillPacer();
+    pacer.last_fill_ms = millis();
+    pacer.pending_settle_ms = settle_ms;
+}
+
+/**
+ * fillRect with deferred power-settle pacing
+ * The display needs recovery time between fills, not after every fill:
+ * instead of sleeping right away, the next paced fill waits only for
+ * whatever part of the previous settle time hasn't already elapsed.
+ * Text and lines drawn in between overlap with the settle window.
+ * @param settle_ms Recovery time required before the next fill
+ */
+inline void fillRectPaced(int32_t x, int32_t y, int32_t w, int32_t h,
+                          uint16_t color, uint32_t settle_ms) {
+    beginPacedFill();
+    tft.fillRect(x, y, w, h, color);
+    endPacedFill(settle_ms);
+}
+
+/**
+ * Rectangle outline of any thickness as 4 solid bands
+ * Costs 4 address windows however thick the frame is (nested drawRect
+ * calls cost 4 per pixel of thickness), all in one SPI transaction.
+ * Bands are thin, far below the fill power limit - no settle needed
+ * @param t Frame thickness in pixels (drawn inside x/y/w/h)
+ */
+inline void drawFrame(int32_t x, int32_t y, int32_t w, int32_t h,
+                      int32_t t, uint16_t color) {
+    tft.startWrite();
+    tft.fillRect(x, y, w, t, color);                          // Top
+    tft.fillRect(x, y + h - t, w, t, color);                  // Bottom
+    tft.fillRect(x, y + t, t, h - 2 * t, color);              // Left
+    tft.fillRect(x + w - t, y + t, t, h - 2 * t, color);      // Right
+    tft.endWrite();
+}
+
+// ============================================================================
+// TEXT SPRITES
+// ============================================================================
+// At text size > 1 TFT_eSPI draws GLCD glyphs as one small fillRect per
+// pixel run. Rendering into a 1-bit sprite instead expands glyphs in RAM,
+// and the whole block (background included) goes out as one window write.
+
+/**
+ * Create a 1-bit sprite for repeatedly redrawn text
+ * @return False if the sprite couldn't be allocated (caller draws directly)
+ */
+inline bool createTextSprite(TFT_eSprite& sprite, int16_t w, int16_t h,
+                             uint8_t text_size, uint16_t fg, uint16_t bg) {
+    sprite.setColorDepth(1);
+    if (!sprite.createSprite(w, h)) {
+        return false;
+    }
+    sprite.setBitmapColor(fg, bg);  // 1 = fg, 0 = bg
+    sprite.setTextColor(1, 0);
+    sprite.setTextSize(text_size);
+    return true;
+}
+
+/**
+ * Render text into a text sprite and push it in one window write
+ * @param text_x Cursor X inside the sprite
+ * @param settle_ms Fill pacing for large blocks (0 = small block, no pacing)
+ */
+inline void pushTextSprite(TFT_eSprite& sprite, int32_t x, int32_t y,
+                           const char* text, int16_t text_x, uint32_t settle_ms) {
+    sprite.fillSprite(0);
+    sprite.setCursor(text_x, 0);
+    sprite.print(text);
+
+    if (settle_ms > 0) {
+        beginPacedFill();
+        sprite.pushSprite(x, y);
+        endPacedFill(settle_ms);
+    } else {
+        sprite.pushSprite(x, y);
+    }
+}
 
 #endif // UI_COMMON_H
@@ -4,6 +4,13 @@
 
 #include "bluetooth.h"
 
+// Verbose connection logging - compiled out unless DEBUG_BLUETOOTH is set
+#if DEBUG_BLUETOOTH
+#define BT_LOG(...) Serial.printf(__VA_ARGS__)
+#else
+#define BT_LOG(...) do {} while (0)
+#endif
+
 // ============================================================================
 // GLOBAL OBJECTS
 // ============================================================================
@@ -23,14 +30,14 @@ void initBluetooth() {
     Serial.println("✓ Bluetooth Serial initialized (Master mode)");
 }
 
-bool connectBluetooth() {
-    Serial.println("\n========================================");
-    Serial.println("Connecting to ELM327 via Bluetooth...");
-    Serial.println("========================================");
-
+/**
+ * Single connection attempt with the currently configured PIN
+ * @return true if connected
+ */
+static bool connectOnce() {
 #if BT_USE_MAC
     // Connect using MAC address (more reliable)
-    Serial.printf("Using MAC address: %s\n", BT_MAC_ADDRESS);
+    BT_LOG("Using MAC address: %s\n", BT_MAC_ADDRESS);
 
     // Convert MAC string to uint8_t array
     uint8_t mac[6];
@@ -41,11 +48,11 @@ bool connectBluetooth() {
     }
 
     // Connect via MAC
-    Serial.println("Attempting connection...");
+    BT_LOG("Attempting connection...\n");
     bool connected = SerialBT.connect(mac);
 
-    Serial.printf("SerialBT.connect() returned: %s\n", connected ? "true" : "false");
-    Serial.printf("SerialBT.connected() = %s\n", SerialBT.connected() ? "true" : "false");
+    BT_LOG("SerialBT.connect() returned: %s\n", connected ? "true" : "false");
+    BT_LOG("SerialBT.connected() = %s\n", SerialBT.connected() ? "true" : "false");
 
     if (!connected) {
         Serial.println("ERROR: Bluetooth connection failed!");
@@ -61,10 +68,10 @@ bool connectBluetooth() {
     }
 #else
     // Connect using device name
-    Serial.printf("Using device name: %s\n", BT_DEVICE_NAME);
+    BT_LOG("Using device name: %s\n", BT_DEVICE_NAME);
 
     bool connected = SerialBT.connect(BT_DEVICE_NAME);
-    Serial.printf("SerialBT.connect() returned: %s\n", connected ? "true" : "false");
+    BT_LOG("SerialBT.connect() returned: %s\n", connected ? "true" : "false");
 
     if (!connected) {
         Serial.println("ERROR: Bluetooth connection failed!");
@@ -72,14 +79,61 @@ bool connectBluetooth() {
     }
 #endif
 
+    return true;
+}
+
+/**
+ * Wait until the adapter answers over the new link
+ * Sends a harmless identify command (ATI) and returns on the '>' prompt
+ * that ends its reply, instead of sleeping a fixed time
+ * @return true if the prompt arrived within ELM327_INIT_DELAY_MS
+ */
+static bool waitForAdapterPrompt() {
+    SerialBT.print("ATI\r");
+
+    unsigned long start = millis();
+    while (millis() - start < ELM327_INIT_DELAY_MS) {
+        while (SerialBT.available() > 0) {
+            if (SerialBT.read() == '>') {
+                return true;
+            }
+        }
+        delay(ELM327_RX_POLL_MS);
+    }
+    return false;
+}
+
+bool connectBluetooth() {
+    Serial.println("\nConnecting to ELM327 via Bluetooth...");
+
+    // Try each PIN in turn (iterative - no re-entry into the connect path)
+    static const char* const pin_candidates[] = {BT_PIN, BT_PIN_FALLBACK};
+    bool connected = false;
+
+    for (const char* pin : pin_candidates) {
+        BT_LOG("Trying PIN %s\n", pin);
+        SerialBT.setPin(pin);
+        if (connectOnce()) {
+            connected = true;
+            break;
+        }
+    }
+
+    if (!connected) {
+        return false;
+    }
+
     Serial.println("✓ Bluetooth connected successfully!");
-    Serial.printf("Connection status: %s\n", SerialBT.connected() ? "CONNECTED" : "DISCONNECTED");
+    BT_LOG("Connection status: %s\n", SerialBT.connected() ? "CONNECTED" : "DISCONNECTED");
 
-    // Wait for connection to stabilize
-    Serial.println("Waiting for connection to stabilize...");
-    delay(ELM327_INIT_DELAY_MS);
+    // Wait for the adapter to respond on the new link (ELM327 init
+    // sends its reset next and handles a slow adapter with its own timeout)
+    BT_LOG("Waiting for adapter prompt...\n");
+    if (!waitForAdapterPrompt()) {
+        Serial.println("WARNING: No adapter prompt yet, continuing with ELM327 init");
+    }
 
-    Serial.printf("After delay - connected: %s\n", SerialBT.connected() ? "true" : "false");
+    BT_LOG("After prompt wait - connected: %s\n", SerialBT.connected() ? "true" : "false");
 
     return true;
 }
@@ -4,6 +4,7 @@
 
 #include "elm327.h"
 #include "bluetooth.h"
+#include "elm327_parse.h"
 
 // ============================================================================
 // GLOBAL OBJECTS
@@ -11,10 +12,26 @@
 
 ELM327 elm327;
 
+// ============================================================================
+// OBD2 COMMANDS
+// ============================================================================
+
+// Pre-terminated with '\r' so every send is a single write
+static const char CMD_READ_DTCS[]       = "03\r";
+static const char CMD_CLEAR_DTCS[]      = "04\r";
+static const char CMD_READ_VIN[]        = "0902\r";
+
+// Adapter tuning applied after ELMduino's init
+static const char CMD_ADAPTIVE_TIMING[] = "ATAT2\r";  // Aggressive adaptive response timing
+static const char CMD_DESCRIBE_PROTOCOL[] = "ATDPN\r"; // Current protocol number
+
 // ============================================================================
 // ELM327 CONNECTION
 // ============================================================================
 
+// Protocol found on an earlier connection ('0' = auto search)
+static char elm_protocol = '0';
+
 bool connectToELM327() {
     // Ensure Bluetooth is connected first
     if (!connectBluetooth()) {
@@ -25,303 +42,394 @@ bool connectToELM327() {
     Serial.println("\nInitializing ELM327...");
 
     // Note: Pass false (not 1) for debug to avoid extra characters in queries
-    if (!elm327.begin(SerialBT, false, ELM327_TIMEOUT_MS)) {
+    // A remembered protocol is tried first; ELMduino still falls back to
+    // auto search if it doesn't answer
+    if (!elm327.begin(SerialBT, false, ELM327_TIMEOUT_MS, elm_protocol)) {
         Serial.println("ERROR: ELM327 initialization failed!");
         Serial.printf("ELM327 Status: %d\n", elm327.nb_rx_state);
         return false;
     }
 
+    // Let the adapter learn the ECU's response time and stop waiting for
+    // further replies sooner (every live query ends on that wait). Not
+    // fatal if a clone doesn't support it - default timing still works
+    const char* reply = sendOBD2Command(CMD_ADAPTIVE_TIMING);
+    if (strstr(reply, "OK") == NULL) {
+        Serial.println("WARNING: ATAT2 not accepted, using default timing");
+    }
+
     Serial.println("✓ ELM327 initialized successfully!");
     return true;
 }
 
+static bool isProtocolChar(char c) {
+    return (c >= '1' && c <= '9') || (c >= 'A' && c <= 'C');
+}
+
+void rememberELM327Protocol() {
+    if (elm_protocol != '0') {
+        return;
+    }
+
+    // Reply is e.g. "A6" (6 found by auto search) or "6"
+    const char* p = sendOBD2Command(CMD_DESCRIBE_PROTOCOL);
+    while (*p == '\r' || *p == '\n' || *p == ' ') p++;
+    if (p[0] == 'A' && isProtocolChar(p[1])) p++;
+
+    if (isProtocolChar(*p)) {
+        elm_protocol = *p;
+        Serial.printf("[ELM327] Protocol %c remembered for reconnects\n", elm_protocol);
+    }
+}
+
 // ============================================================================
 // OBD2 COMMUNICATION
 // ============================================================================
 
-String sendOBD2Command(String cmd) {
-    // Clear input buffer
-    while (SerialBT.available()) {
-        SerialBT.read();
+const char* sendOBD2Command(const char* cmd) {
+    // Single static response buffer reused for every command (no heap use)
+    static char response[ELM327_RX_BUFFER_SIZE];
+    size_t len = 0;
+
+    // Whether the previous command was read up to its '>' prompt. The
+    // adapter sends nothing after the prompt, so stale input can only be
+    // left over from a command that timed out (a late reply)
+    static bool rx_in_sync = false;
+
+    // Clear input buffer only when stale bytes are possible - discard them
+    // in chunks, not one read() per byte
+    uint8_t discard[32];
+    if (!rx_in_sync) {
+        int pending;
+        while ((pending = SerialBT.available()) > 0) {
+            SerialBT.readBytes(discard, min(pending, (int)sizeof(discard)));
+        }
     }
+    rx_in_sync = false;  // Until this reply's prompt arrives
 
-    // Send command
-    SerialBT.print(cmd + "\r");
+    // Send command (already '\r'-terminated - one write, no concatenation)
+    SerialBT.write((const uint8_t*)cmd, strlen(cmd));
 
     // Wait for response
+    // BluetoothSerial has no blocking read-until-terminator (Stream's
+    // readBytesUntil() busy-spins, which would starve Core 0's idle task),
+    // so poll the RX queue: every byte already queued is taken in one
+    // bulk read, and the task only sleeps one tick while the queue is empty
     unsigned long start = millis();
-    String response = "";
 
-    while (millis() - start < 2000) {  // 2 second timeout
-        if (SerialBT.available()) {
-            char c = SerialBT.read();
-            response += c;
+    while (millis() - start < ELM327_TIMEOUT_MS) {
+        int available = SerialBT.available();
+        if (available <= 0) {
+            delay(ELM327_RX_POLL_MS);  // Only sleep while the adapter is still busy
+            continue;
+        }
 
-            // Check for end of response ('>')
-            if (c == '>') {
+        // Consume everything that has arrived in one bulk read
+        size_t room = sizeof(response) - 1 - len;
+        if (room > 0) {
+            size_t n = SerialBT.readBytes((uint8_t*)response + len, min((size_t)available, room));
+            const char* prompt = (const char*)memchr(response + len, '>', n);
+            len += n;
+
+            // Check for end of response ('>') - anything after it is dropped
+            if (prompt != NULL) {
+                len = prompt - response + 1;
+                response[len] = '\0';
+                rx_in_sync = true;
+                return response;
+            }
+        } else {
+            // Overlong reply: buffer is full, keep draining until the prompt
+            size_t n = SerialBT.readBytes(discard, min(available, (int)sizeof(discard)));
+            if (memchr(discard, '>', n) != NULL) {
+                rx_in_sync = true;
                 break;
             }
         }
-        delay(1);
     }
 
+    response[len] = '\0';
     return response;
 }
 
-int parseHexByte(String response, int byteIndex) {
-    // Response format: "41 05 A0 >"
-    // "41" = mode response, "05" = PID echo, "A0" = actual data
-    int startPos = response.indexOf("41");
-    if (startPos < 0) return -1;
-
-    // Skip "41 XX " (mode response + PID + spaces = 6 characters)
-    String data = response.substring(startPos + 6);
-    data.trim();
+static const char HEX_DIGITS[] = "0123456789ABCDEF";
 
-    // Find the nth hex byte
-    int currentByte = 0;
-    int pos = 0;
-
-    while (pos < data.length() && currentByte <= byteIndex) {
-        // Skip spaces
-        while (pos < data.length() && data[pos] == ' ') pos++;
-
-        if (currentByte == byteIndex) {
-            // Found our byte - parse it
-            String hexByte = data.substring(pos, pos + 2);
-            return strtol(hexByte.c_str(), NULL, 16);
-        }
 
-        // Move to next byte
-        pos += 2;
-        currentByte++;
-    }
+// ============================================================================
+// PID DECODE KERNELS
+// ============================================================================
+// SAE J1979 formulas on raw data bytes. Integer shifts where exact, single
+// precision float otherwise (the ESP32 FPU has no double support, so the
+// old 100.0 / 1000.0 double literals fell back to soft-float routines)
 
-    return -1;
-}
+static inline int decodeRPM(uint8_t a, uint8_t b)         { return ((a << 8) | b) >> 2; }
+static inline int decodeTemperature(uint8_t a)            { return (int)a - 40; }
+static inline float decodePercent(uint8_t a)              { return a * (100.0f / 255.0f); }
+static inline float decodeModuleVoltage(uint8_t a, uint8_t b) { return ((a << 8) | b) * 0.001f; }
 
 // ============================================================================
-// PID QUERIES
+// MULTI-PID QUERY
 // ============================================================================
 
-int queryRPM() {
-    String response = sendOBD2Command("010C");
-    int A = parseHexByte(response, 0);
-    int B = parseHexByte(response, 1);
-
-    if (A >= 0 && B >= 0) {
-        return ((A * 256) + B) / 4;
+// Data length and decoder for every live PID, so a combined reply can be
+// split without knowing which PIDs the ECU chose to answer
+struct LivePIDDecoder {
+    uint8_t pid;
+    uint8_t data_bytes;
+    float (*decode)(const uint8_t* d);
+};
+
+static float decodeRPMBytes(const uint8_t* d)         { return decodeRPM(d[0], d[1]); }
+static float decodeSpeedBytes(const uint8_t* d)       { return d[0]; }
+static float decodeTemperatureBytes(const uint8_t* d) { return decodeTemperature(d[0]); }
+static float decodePercentBytes(const uint8_t* d)     { return decodePercent(d[0]); }
+static float decodeVoltageBytes(const uint8_t* d)     { return decodeModuleVoltage(d[0], d[1]); }
+
+static const LivePIDDecoder LIVE_PID_DECODERS[] = {
+    {PID_COOLANT_TEMP,    1, decodeTemperatureBytes},
+    {PID_RPM,             2, decodeRPMBytes},
+    {PID_SPEED,           1, decodeSpeedBytes},
+    {PID_INTAKE_TEMP,     1, decodeTemperatureBytes},
+    {PID_THROTTLE,        1, decodePercentBytes},
+    {PID_BATTERY_VOLTAGE, 2, decodeVoltageBytes},
+};
+
+static const LivePIDDecoder* findLivePIDDecoder(uint8_t pid) {
+    for (const LivePIDDecoder& dec : LIVE_PID_DECODERS) {
+        if (dec.pid == pid) return &dec;
     }
-    return -1;
+    return NULL;
 }
 
-int querySpeed() {
-    String response = sendOBD2Command("010D");
-    int A = parseHexByte(response, 0);
-    return A;
-}
-
-float queryCoolantTemp() {
-    String response = sendOBD2Command("0105");
-    int A = parseHexByte(response, 0);
-
-    if (A >= 0) {
-        return A - 40.0;
+int queryLivePIDs(const uint8_t* pids, int count, LiveSample* out) {
+    if (count < 1 || count > MAX_PIDS_PER_REQUEST) {
+        return -1;
     }
-    return -999;
-}
-
-float queryThrottle() {
-    String response = sendOBD2Command("0111");
-    int A = parseHexByte(response, 0);
 
-    if (A >= 0) {
-        return (A * 100.0) / 255.0;
+    // Build "01" + one hex pair per PID + '\r', e.g. "01050C0D0F1142\r"
+    // The caller sends the same const PID list every cycle, so the command
+    // is built once and only rebuilt if a different list comes in
+    static char cmd[2 + 2 * MAX_PIDS_PER_REQUEST + 2];  // Mode, PIDs, '\r', '\0'
+    static const uint8_t* cmd_pids = NULL;
+    static int cmd_count = 0;
+    if (pids != cmd_pids || count != cmd_count) {
+        int len = 0;
+        cmd[len++] = '0';
+        cmd[len++] = '1';
+        for (int i = 0; i < count; i++) {
+            cmd[len++] = HEX_DIGITS[pids[i] >> 4];
+            cmd[len++] = HEX_DIGITS[pids[i] & 0x0F];
+        }
+        cmd[len++] = '\r';
+        cmd[len] = '\0';
+        cmd_pids = pids;
+        cmd_count = count;
     }
-    return -1;
-}
-
-float queryIntakeTemp() {
-    String response = sendOBD2Command("010F");
-    int A = parseHexByte(response, 0);
 
-    if (A >= 0) {
-        return A - 40.0;
+    const char* response = sendOBD2Command(cmd);
+
+    // Reply is "41" followed by <pid><data...> groups, e.g.
+    // "41 05 7B 0C 1A F8 0D 00". On CAN it arrives as an ISO-TP multi-frame
+    // ("00E\r0: 41 05 7B 0C 1A\r1: F8 0D ..."): the length line and frame
+    // indices never start a "41" group, and trailing 00 padding is not a
+    // live PID, so both fall out of the walk below
+    enum { WANT_MODE, WANT_PID, WANT_DATA } state = WANT_MODE;
+    const LivePIDDecoder* dec = NULL;
+    uint8_t data[2];
+    int have = 0;
+    int n = 0;
+    const char* p = response;
+    uint8_t b;
+
+    while (n < count && (p = nextHexByte(p, &b)) != NULL) {
+        switch (state) {
+            case WANT_MODE:
+                if (b == 0x41) state = WANT_PID;
+                break;
+            case WANT_PID:
+                if (b == 0x41) break;  // Next ECU's reply starts
+                dec = findLivePIDDecoder(b);
+                have = 0;
+                state = dec ? WANT_DATA : WANT_MODE;
+                break;
+            case WANT_DATA:
+                data[have++] = b;
+                if (have == dec->data_bytes) {
+                    out[n].pid = dec->pid;
+                    out[n].value = dec->decode(data);
+                    n++;
+                    state = WANT_PID;
+                }
+                break;
+        }
     }
-    return -999;
-}
-
-float queryBatteryVoltage() {
-    String response = sendOBD2Command("0142");
-    int A = parseHexByte(response, 0);
-    int B = parseHexByte(response, 1);
 
-    if (A >= 0 && B >= 0) {
-        return ((A * 256) + B) / 1000.0;
-    }
-    return -1;
+    return (n > 0) ? n : -1;
 }
 
 // ============================================================================
 // DTC FUNCTIONS
 // ============================================================================
 
-void parseDTC(uint16_t dtc_value, char* code) {
-    // Extract parts
-    uint8_t prefix = (dtc_value >> 14) & 0x03;
-    uint8_t digit1 = (dtc_value >> 12) & 0x03;
-    uint8_t digit2 = (dtc_value >> 8) & 0x0F;
-    uint8_t digit3 = (dtc_value >> 4) & 0x0F;
-    uint8_t digit4 = dtc_value & 0x0F;
-
-    // Determine prefix letter
-    char prefix_char;
-    switch (prefix) {
-        case 0: prefix_char = 'P'; break;  // Powertrain
-        case 1: prefix_char = 'C'; break;  // Chassis
-        case 2: prefix_char = 'B'; break;  // Body
-        case 3: prefix_char = 'U'; break;  // Network
-        default: prefix_char = 'P'; break;
-    }
+// DTC system letter (top 2 bits) and hex digit lookup tables
+static const char DTC_PREFIX_CHARS[4] = {'P', 'C', 'B', 'U'};  // Powertrain, Chassis, Body, Network
 
-    // Format code
-    snprintf(code, 6, "%c%d%X%X%X", prefix_char, digit1, digit2, digit3, digit4);
+void parseDTC(uint16_t dtc_value, char* code) {
+    // Byte layout: [PP DD XXXX] [XXXX XXXX] -> "PDXXX"
+    code[0] = DTC_PREFIX_CHARS[(dtc_value >> 14) & 0x03];
+    code[1] = '0' + ((dtc_value >> 12) & 0x03);
+    code[2] = HEX_DIGITS[(dtc_value >> 8) & 0x0F];
+    code[3] = HEX_DIGITS[(dtc_value >> 4) & 0x0F];
+    code[4] = HEX_DIGITS[dtc_value & 0x0F];
+    code[5] = '\0';
 }
 
-const char* getDTCDescription(const char* code) {
+// Known DTCs - struct-of-arrays in flash (.rodata): the lookup scan only
+// touches the code strings, description/severity are indexed afterwards
+static const char* const DTC_CODES[] = {
     // Critical codes - Engine damage risk
-    if (strcmp(code, "P0300") == 0) return "Random Misfire Detected";
-    if (strcmp(code, "P0301") == 0) return "Cylinder 1 Misfire";
-    if (strcmp(code, "P0302") == 0) return "Cylinder 2 Misfire";
-    if (strcmp(code, "P0303") == 0) return "Cylinder 3 Misfire";
-    if (strcmp(code, "P0304") == 0) return "Cylinder 4 Misfire";
-    if (strcmp(code, "P0217") == 0) return "Engine Overheat Condition";
-    if (strcmp(code, "P0218") == 0) return "Transmission Overheat";
-    if (strcmp(code, "P0524") == 0) return "Engine Oil Pressure Too Low";
-    if (strcmp(code, "P0522") == 0) return "Oil Pressure Sensor Low";
-    if (strcmp(code, "P0523") == 0) return "Oil Pressure Sensor High";
-    if (strcmp(code, "P0016") == 0) return "Crankshaft/Camshaft Correlation";
-    if (strcmp(code, "P0017") == 0) return "Crankshaft/Camshaft Correlation B1";
-    if (strcmp(code, "P0335") == 0) return "Crankshaft Position Sensor";
-    if (strcmp(code, "P0340") == 0) return "Camshaft Position Sensor";
-    
+    "P0300", "P0301", "P0302", "P0303", "P0304", "P0217", "P0218",
+    "P0524", "P0522", "P0523", "P0016", "P0017", "P0335", "P0340",
+
     // Warning codes - Performance/Emissions
-    if (strcmp(code, "P0420") == 0) return "Catalyst Efficiency Low B1";
-    if (strcmp(code, "P0430") == 0) return "Catalyst Efficiency Low B2";
-    if (strcmp(code, "P0171") == 0) return "System Too Lean B1";
-    if (strcmp(code, "P0172") == 0) return "System Too Rich B1";
-    if (strcmp(code, "P0174") == 0) return "System Too Lean B2";
-    if (strcmp(code, "P0175") == 0) return "System Too Rich B2";
-    if (strcmp(code, "P0440") == 0) return "EVAP System Malfunction";
-    if (strcmp(code, "P0442") == 0) return "EVAP System Small Leak";
-    if (strcmp(code, "P0455") == 0) return "EVAP System Large Leak";
-    if (strcmp(code, "P0456") == 0) return "EVAP System Very Small Leak";
-    if (strcmp(code, "P0128") == 0) return "Coolant Thermostat Malfunction";
-    if (strcmp(code, "P0133") == 0) return "O2 Sensor Slow Response B1S1";
-    if (strcmp(code, "P0134") == 0) return "O2 Sensor No Activity B1S1";
-    if (strcmp(code, "P0135") == 0) return "O2 Sensor Heater B1S1";
-    if (strcmp(code, "P0141") == 0) return "O2 Sensor Heater B1S2";
-    if (strcmp(code, "P0401") == 0) return "EGR Insufficient Flow";
-    if (strcmp(code, "P0402") == 0) return "EGR Excessive Flow";
-    if (strcmp(code, "P0411") == 0) return "Secondary Air Injection";
-    if (strcmp(code, "P0606") == 0) return "ECM Processor Fault";
-    if (strcmp(code, "P0244") == 0) return "Wastegate Solenoid";
-    
+    "P0420", "P0430", "P0171", "P0172", "P0174", "P0175", "P0440",
+    "P0442", "P0455", "P0456", "P0128", "P0133", "P0134", "P0135",
+    "P0141", "P0401", "P0402", "P0411", "P0606", "P0244",
+
     // Info codes - Sensor issues
-    if (strcmp(code, "P0101") == 0) return "MAF Sensor Range/Performance";
-    if (strcmp(code, "P0102") == 0) return "MAF Sensor Circuit Low";
-    if (strcmp(code, "P0103") == 0) return "MAF Sensor Circuit High";
-    if (strcmp(code, "P0106") == 0) return "MAP Sensor Range/Performance";
-    if (strcmp(code, "P0107") == 0) return "MAP Sensor Circuit Low";
-    if (strcmp(code, "P0108") == 0) return "MAP Sensor Circuit High";
-    if (strcmp(code, "P0112") == 0) return "Intake Air Temp Sensor Low";
-    if (strcmp(code, "P0113") == 0) return "Intake Air Temp Sensor High";
-    if (strcmp(code, "P0116") == 0) return "Coolant Temp Sensor Range";
-    if (strcmp(code, "P0117") == 0) return "Coolant Temp Sensor Low";
-    if (strcmp(code, "P0118") == 0) return "Coolant Temp Sensor High";
-    if (strcmp(code, "P0122") == 0) return "Throttle Position Sensor Low";
-    if (strcmp(code, "P0123") == 0) return "Throttle Position Sensor High";
-    if (strcmp(code, "P0562") == 0) return "System Voltage Low";
-    if (strcmp(code, "P0563") == 0) return "System Voltage High";
-
-    return "Unknown DTC";
-}
+    "P0101", "P0102", "P0103", "P0106", "P0107", "P0108", "P0112",
+    "P0113", "P0116", "P0117", "P0118", "P0122", "P0123", "P0562",
+    "P0563",
+};
 
-uint8_t getDTCSeverity(const char* code) {
-    // Critical codes (engine damage risk)
-    if (strcmp(code, "P0300") == 0) return DTC_SEVERITY_CRITICAL;  // Random misfire
-    if (strcmp(code, "P0301") == 0) return DTC_SEVERITY_CRITICAL;  // Cylinder 1 misfire
-    if (strcmp(code, "P0302") == 0) return DTC_SEVERITY_CRITICAL;  // Cylinder 2 misfire
-    if (strcmp(code, "P0303") == 0) return DTC_SEVERITY_CRITICAL;  // Cylinder 3 misfire
-    if (strcmp(code, "P0304") == 0) return DTC_SEVERITY_CRITICAL;  // Cylinder 4 misfire
-    if (strcmp(code, "P0217") == 0) return DTC_SEVERITY_CRITICAL;  // Engine overheating
-    if (strcmp(code, "P0218") == 0) return DTC_SEVERITY_CRITICAL;  // Transmission overheating
-    if (strcmp(code, "P0524") == 0) return DTC_SEVERITY_CRITICAL;  // Oil pressure too low
-    if (strcmp(code, "P0522") == 0) return DTC_SEVERITY_CRITICAL;  // Oil pressure sensor low
-    if (strcmp(code, "P0523") == 0) return DTC_SEVERITY_CRITICAL;  // Oil pressure sensor high
-    if (strcmp(code, "P0016") == 0) return DTC_SEVERITY_CRITICAL;  // Cam/Crank correlation
-    if (strcmp(code, "P0017") == 0) return DTC_SEVERITY_CRITICAL;  // Cam/Crank correlation Bank 1
-    if (strcmp(code, "P0335") == 0) return DTC_SEVERITY_CRITICAL;  // Crankshaft position sensor
-    if (strcmp(code, "P0340") == 0) return DTC_SEVERITY_CRITICAL;  // Camshaft position sensor
-    
-    // Warning codes (performance/emissions)
-    if (strcmp(code, "P0420") == 0) return DTC_SEVERITY_WARNING;   // Catalyst efficiency
-    if (strcmp(code, "P0430") == 0) return DTC_SEVERITY_WARNING;   // Catalyst efficiency Bank 2
-    if (strcmp(code, "P0171") == 0) return DTC_SEVERITY_WARNING;   // System too lean Bank 1
-    if (strcmp(code, "P0172") == 0) return DTC_SEVERITY_WARNING;   // System too rich Bank 1
-    if (strcmp(code, "P0174") == 0) return DTC_SEVERITY_WARNING;   // System too lean Bank 2
-    if (strcmp(code, "P0175") == 0) return DTC_SEVERITY_WARNING;   // System too rich Bank 2
-    if (strcmp(code, "P0440") == 0) return DTC_SEVERITY_WARNING;   // EVAP system
-    if (strcmp(code, "P0442") == 0) return DTC_SEVERITY_WARNING;   // EVAP leak small
-    if (strcmp(code, "P0455") == 0) return DTC_SEVERITY_WARNING;   // EVAP leak large
-    if (strcmp(code, "P0456") == 0) return DTC_SEVERITY_WARNING;   // EVAP leak very small
-    if (strcmp(code, "P0128") == 0) return DTC_SEVERITY_WARNING;   // Coolant thermostat
-    if (strcmp(code, "P0133") == 0) return DTC_SEVERITY_WARNING;   // O2 sensor slow response
-    if (strcmp(code, "P0134") == 0) return DTC_SEVERITY_WARNING;   // O2 sensor no activity
-    if (strcmp(code, "P0135") == 0) return DTC_SEVERITY_WARNING;   // O2 sensor heater
-    if (strcmp(code, "P0141") == 0) return DTC_SEVERITY_WARNING;   // O2 sensor heater Bank 1 Sensor 2
-    if (strcmp(code, "P0401") == 0) return DTC_SEVERITY_WARNING;   // EGR insufficient flow
-    if (strcmp(code, "P0402") == 0) return DTC_SEVERITY_WARNING;   // EGR excessive flow
-    if (strcmp(code, "P0411") == 0) return DTC_SEVERITY_WARNING;   // Secondary air injection
-    if (strcmp(code, "P0606") == 0) return DTC_SEVERITY_WARNING;   // ECM processor fault
-    
-    return DTC_SEVERITY_INFO;  // Default for unknown codes
-}
+static const char* const DTC_DESCRIPTIONS[] = {
+    // Critical codes - Engine damage risk
+    "Random Misfire Detected",
+    "Cylinder 1 Misfire",
+    "Cylinder 2 Misfire",
+    "Cylinder 3 Misfire",
+    "Cylinder 4 Misfire",
+    "Engine Overheat Condition",
+    "Transmission Overheat",
+    "Engine Oil Pressure Too Low",
+    "Oil Pressure Sensor Low",
+    "Oil Pressure Sensor High",
+    "Crankshaft/Camshaft Correlation",
+    "Crankshaft/Camshaft Correlation B1",
+    "Crankshaft Position Sensor",
+    "Camshaft Position Sensor",
 
-void sortDTCsBySeverity() {
-    // Need to access global obd_data - include obd_data.h
-    extern OBDData obd_data;
-    extern SemaphoreHandle_t data_mutex;
+    // Warning codes - Performance/Emissions
+    "Catalyst Efficiency Low B1",
+    "Catalyst Efficiency Low B2",
+    "System Too Lean B1",
+    "System Too Rich B1",
+    "System Too Lean B2",
+    "System Too Rich B2",
+    "EVAP System Malfunction",
+    "EVAP System Small Leak",
+    "EVAP System Large Leak",
+    "EVAP System Very Small Leak",
+    "Coolant Thermostat Malfunction",
+    "O2 Sensor Slow Response B1S1",
+    "O2 Sensor No Activity B1S1",
+    "O2 Sensor Heater B1S1",
+    "O2 Sensor Heater B1S2",
+    "EGR Insufficient Flow",
+    "EGR Excessive Flow",
+    "Secondary Air Injection",
+    "ECM Processor Fault",
+    "Wastegate Solenoid",
+
+    // Info codes - Sensor issues
+    "MAF Sensor Range/Performance",
+    "MAF Sensor Circuit Low",
+    "MAF Sensor Circuit High",
+    "MAP Sensor Range/Performance",
+    "MAP Sensor Circuit Low",
+    "MAP Sensor Circuit High",
+    "Intake Air Temp Sensor Low",
+    "Intake Air Temp Sensor High",
+    "Coolant Temp Sensor Range",
+    "Coolant Temp Sensor Low",
+    "Coolant Temp Sensor High",
+    "Throttle Position Sensor Low",
+    "Throttle Position Sensor High",
+    "System Voltage Low",
+    "System Voltage High",
+};
+
+static const uint8_t DTC_SEVERITIES[] = {
+    // Critical codes - Engine damage risk
+    DTC_SEVERITY_CRITICAL, DTC_SEVERITY_CRITICAL, DTC_SEVERITY_CRITICAL,
+    DTC_SEVERITY_CRITICAL, DTC_SEVERITY_CRITICAL, DTC_SEVERITY_CRITICAL,
+    DTC_SEVERITY_CRITICAL, DTC_SEVERITY_CRITICAL, DTC_SEVERITY_CRITICAL,
+    DTC_SEVERITY_CRITICAL, DTC_SEVERITY_CRITICAL, DTC_SEVERITY_CRITICAL,
+    DTC_SEVERITY_CRITICAL, DTC_SEVERITY_CRITICAL,
+
+    // Warning codes - Performance/Emissions
+    DTC_SEVERITY_WARNING, DTC_SEVERITY_WARNING, DTC_SEVERITY_WARNING,
+    DTC_SEVERITY_WARNING, DTC_SEVERITY_WARNING, DTC_SEVERITY_WARNING,
+    DTC_SEVERITY_WARNING, DTC_SEVERITY_WARNING, DTC_SEVERITY_WARNING,
+    DTC_SEVERITY_WARNING, DTC_SEVERITY_WARNING, DTC_SEVERITY_WARNING,
+    DTC_SEVERITY_WARNING, DTC_SEVERITY_WARNING, DTC_SEVERITY_WARNING,
+    DTC_SEVERITY_WARNING, DTC_SEVERITY_WARNING, DTC_SEVERITY_WARNING,
+    DTC_SEVERITY_WARNING, DTC_SEVERITY_INFO,  // P0606, P0244 (wastegate - info only)
 
+    // Info codes - Sensor issues
+    DTC_SEVERITY_INFO, DTC_SEVERITY_INFO, DTC_SEVERITY_INFO,
+    DTC_SEVERITY_INFO, DTC_SEVERITY_INFO, DTC_SEVERITY_INFO,
+    DTC_SEVERITY_INFO, DTC_SEVERITY_INFO, DTC_SEVERITY_INFO,
+    DTC_SEVERITY_INFO, DTC_SEVERITY_INFO, DTC_SEVERITY_INFO,
+    DTC_SEVERITY_INFO, DTC_SEVERITY_INFO, DTC_SEVERITY_INFO,
+};
+
+static const int DTC_TABLE_SIZE = sizeof(DTC_CODES) / sizeof(DTC_CODES[0]);
+static_assert(sizeof(DTC_DESCRIPTIONS) / sizeof(DTC_DESCRIPTIONS[0]) == DTC_TABLE_SIZE &&
+              sizeof(DTC_SEVERITIES) == DTC_TABLE_SIZE,
+              "DTC tables out of sync");
+
+/**
+ * Index of a code in the DTC tables, or -1 if unknown
+ */
+static int findDTCIndex(const char* code) {
+    for (int i = 0; i < DTC_TABLE_SIZE; i++) {
+        if (strcmp(code, DTC_CODES[i]) == 0) {
+            return i;
+        }
+    }
+    return -1;
+}
+
+void sortDTCsBySeverity(DTC* dtcs, int count) {
     // Simple bubble sort by severity (critical = 2, warning = 1, info = 0)
-    for (int i = 0; i < obd_data.dtc_count - 1; i++) {
-        for (int j = 0; j < obd_data.dtc_count - i - 1; j++) {
-            if (obd_data.dtc_codes[j].severity < obd_data.dtc_codes[j + 1].severity) {
+    for (int i = 0; i < count - 1; i++) {
+        for (int j = 0; j < count - i - 1; j++) {
+            if (dtcs[j].severity < dtcs[j + 1].severity) {
                 // Swap
-                DTC temp = obd_data.dtc_codes[j];
-                obd_data.dtc_codes[j] = obd_data.dtc_codes[j + 1];
-                obd_data.dtc_codes[j + 1] = temp;
+                DTC temp = dtcs[j];
+                dtcs[j] = dtcs[j + 1];
+                dtcs[j + 1] = temp;
             }
         }
     }
 }
 
-void queryDTCs() {
-    extern OBDData obd_data;
-    extern SemaphoreHandle_t data_mutex;
 
+void queryDTCs() {
     Serial.println("[DTC] Querying diagnostic trouble codes...");
 
     // Send Mode 03 command
-    String response = sendOBD2Command("03");
-
-    Serial.printf("[DTC] Response: %s\n", response.c_str());
-
-    // Parse response
-    // Response format: "43 [count] [DTC1_H] [DTC1_L] [DTC2_H] [DTC2_L] ..."
-    int startPos = response.indexOf("43");
-    if (startPos < 0) {
-        Serial.println("[DTC] No DTCs found or invalid response");
+    const char* response = sendOBD2Command(CMD_READ_DTCS);
+
+    // Parse into a local list first - the mutex is only held for the copy,
+    // not for parsing, table lookups and Serial output
+    const int max_dtcs = sizeof(obd_data.dtc_codes) / sizeof(obd_data.dtc_codes[0]);
+    uint16_t values[max_dtcs];
+    int dtc_index = parseDTCResponse(response, values, max_dtcs);
+    if (dtc_index < 0) {
+        // Raw reply is only worth printing when it could not be parsed
+        Serial.printf("[DTC] No DTCs found or invalid response: %s\n", response);
         xSemaphoreTake(data_mutex, portMAX_DELAY);
         obd_data.dtc_count = 0;
         obd_data.dtc_fetched = true;
@@ -329,84 +437,42 @@ void queryDTCs() {
         return;
     }
 
-    // Skip "43 " to get to data
-    String data = response.substring(startPos + 3);
-    data.trim();
-
-    // Parse hex bytes
-    int dtc_index = 0;
-    int pos = 0;
-
-    xSemaphoreTake(data_mutex, portMAX_DELAY);
-
-    while (pos < data.length() && dtc_index < 12) {
-        // Skip spaces
-        while (pos < data.length() && data[pos] == ' ') pos++;
-        if (pos >= data.length()) break;
-
-        // Read high byte
-        String high_byte_str = data.substring(pos, pos + 2);
-        pos += 2;
-        while (pos < data.length() && data[pos] == ' ') pos++;
-        if (pos >= data.length()) break;
-
-        // Read low byte
-        String low_byte_str = data.substring(pos, pos + 2);
-        pos += 2;
-
-        // Convert to DTC value
-        uint8_t high_byte = strtol(high_byte_str.c_str(), NULL, 16);
-        uint8_t low_byte = strtol(low_byte_str.c_str(), NULL, 16);
-        uint16_t dtc_value = (high_byte << 8) | low_byte;
-
-        // Skip if 0x0000 (no more DTCs)
-        if (dtc_value == 0x0000) break;
-
+    DTC parsed[max_dtcs];
+    for (int i = 0; i < dtc_index; i++) {
         // Parse DTC code
-        parseDTC(dtc_value, obd_data.dtc_codes[dtc_index].code);
+        DTC& dtc = parsed[i];
+        parseDTC(values[i], dtc.code);
 
-        // Get description and severity
-        const char* desc = getDTCDescription(obd_data.dtc_codes[dtc_index].code);
-        strncpy(obd_data.dtc_codes[dtc_index].description, desc, 79);
-        obd_data.dtc_codes[dtc_index].description[79] = '\0';
-        obd_data.dtc_codes[dtc_index].severity = getDTCSeverity(obd_data.dtc_codes[dtc_index].code);
+        // Get description and severity (single table lookup)
+        int info_idx = findDTCIndex(dtc.code);
+        dtc.description = (info_idx >= 0) ? DTC_DESCRIPTIONS[info_idx] : "Unknown DTC";
+        dtc.severity = (info_idx >= 0) ? DTC_SEVERITIES[info_idx] : DTC_SEVERITY_INFO;
 
         Serial.printf("[DTC] Found: %s - %s (severity=%d)\n",
-                      obd_data.dtc_codes[dtc_index].code,
-                      obd_data.dtc_codes[dtc_index].description,
-                      obd_data.dtc_codes[dtc_index].severity);
-
-        dtc_index++;
+                      dtc.code, dtc.description, dtc.severity);
     }
 
+    // Sort before publishing, so readers never see an unsorted list
+    // (display relies on dtc_codes[0] being most severe)
+    sortDTCsBySeverity(parsed, dtc_index);
+
+    xSemaphoreTake(data_mutex, portMAX_DELAY);
+    memcpy(obd_data.dtc_codes, parsed, dtc_index * sizeof(DTC));
     obd_data.dtc_count = dtc_index;
     obd_data.dtc_fetched = true;
-
     xSemaphoreGive(data_mutex);
 
-    // Sort by severity
-    if (obd_data.dtc_count > 0) {
-        xSemaphoreTake(data_mutex, portMAX_DELAY);
-        sortDTCsBySeverity();
-        xSemaphoreGive(data_mutex);
-    }
-
-    Serial.printf("[DTC] Total DTCs found: %d\n", obd_data.dtc_count);
+    Serial.printf("[DTC] Total DTCs found: %d\n", dtc_index);
 }
 
 bool clearAllDTCs() {
-    extern OBDData obd_data;
-    extern SemaphoreHandle_t data_mutex;
-
     Serial.println("[DTC] Clearing all DTCs from ECU...");
 
     // Send Mode 04 command
-    String response = sendOBD2Command("04");
-
-    Serial.printf("[DTC] Clear response: %s\n", response.c_str());
+    const char* response = sendOBD2Command(CMD_CLEAR_DTCS);
 
     // Check for positive response (44 = Mode 04 response)
-    if (response.indexOf("44") >= 0) {
+    if (strstr(response, "44") != NULL) {
         Serial.println("[DTC] DTCs cleared successfully from ECU");
 
         // Clear local DTC list
@@ -417,7 +483,7 @@ bool clearAllDTCs() {
 
         return true;
     } else {
-        Serial.println("[DTC] Failed to clear DTCs");
+        Serial.printf("[DTC] Failed to clear DTCs, response: %s\n", response);
         return false;
     }
 }
@@ -427,40 +493,40 @@ bool clearAllDTCs() {
 // ============================================================================
 
 void queryVIN() {
-    extern OBDData obd_data;
-    extern SemaphoreHandle_t data_mutex;
-
     Serial.println("[VIN] Querying Vehicle Identification Number...");
 
     // Send Mode 09, PID 02 command
-    String response = sendOBD2Command("0902");
+    const char* response = sendOBD2Command(CMD_READ_VIN);
 
-    Serial.printf("[VIN] Response: %s\n", response.c_str());
-
-    // Parse VIN from response
-    // Response format: "49 02 01 [VIN bytes in ASCII]"
+    // Parse VIN from response in one pass over the hex bytes
+    // Response format: "49 02 01 [VIN bytes in ASCII]" - multi-line (non-CAN)
+    // replies repeat the "49 02 <n>" header per line, CAN replies add a
+    // length line and frame indices, which aren't printable bytes
     // VIN is 17 characters long
-    if (response.indexOf("49 02") >= 0 || response.indexOf("4902") >= 0) {
-        // Remove spaces and mode/PID prefix
-        response.replace(" ", "");
-        response.replace("4902", "");
-        response.replace("01", "");  // Remove line counter if present
-
-        // Extract VIN (next 34 hex chars = 17 ASCII chars)
-        char vin[18] = {0};
-        int vin_idx = 0;
-
-        for (int i = 0; i < response.length() - 1 && vin_idx < 17; i += 2) {
-            char hex[3] = {response[i], response[i+1], '\0'};
-            int ascii_val = strtol(hex, NULL, 16);
-
-            // Only accept printable ASCII characters (0x20-0x7E)
-            if (ascii_val >= 0x20 && ascii_val <= 0x7E) {
-                vin[vin_idx++] = (char)ascii_val;
-            }
+    char vin[18];
+    int vin_idx = 0;
+    bool found = false;
+    bool skip_counter = false;
+    uint8_t prev = 0;
+    uint8_t b;
+    const char* p = response;
+
+    while (vin_idx < 17 && (p = nextHexByte(p, &b)) != NULL) {
+        if (prev == 0x49 && b == 0x02) {
+            found = true;
+            skip_counter = true;  // Next byte is the message/line counter
+        } else if (skip_counter) {
+            skip_counter = false;
+        } else if (found && b >= 0x20 && b <= 0x7E && b != 0x49) {
+            // Only accept printable ASCII characters (0x20-0x7E). 'I' (0x49)
+            // is never used in a VIN, so it is always the start of a header
+            vin[vin_idx++] = (char)b;
         }
-        vin[vin_idx] = '\0';
+        prev = b;
+    }
+    vin[vin_idx] = '\0';
 
+    if (found) {
         if (vin_idx == 17) {
             Serial.printf("[VIN] Successfully retrieved: %s\n", vin);
 
@@ -477,7 +543,7 @@ void queryVIN() {
             xSemaphoreGive(data_mutex);
         }
     } else {
-        Serial.println("[VIN] VIN not supported or invalid response");
+        Serial.printf("[VIN] VIN not supported or invalid response: %s\n", response);
         xSemaphoreTake(data_mutex, portMAX_DELAY);
         strcpy(obd_data.vin, "Not Supported");
         obd_data.vin_fetched = false;
@@ -36,59 +36,34 @@ extern ELM327 elm327;
 bool connectToELM327();
 
 /**
- * Send OBD2 command and read response
- * @param cmd Command string (e.g., "010C" for RPM)
- * @return Response string from ELM327
+ * Remember the OBD protocol the adapter is using (ATDPN), so later
+ * connections select it directly instead of auto-searching again
+ * Call once the ECU has answered a query; no-op once a protocol is known
  */
-String sendOBD2Command(String cmd);
+void rememberELM327Protocol();
 
 /**
- * Parse hex byte from OBD2 response
- * @param response The full OBD2 response string
- * @param byteIndex The data byte index (0 = first data byte after PID)
- * @return Parsed byte value, or -1 on error
+ * Send OBD2 command and read response
+ * @param cmd Command string including the '\r' terminator (e.g., "010C\r" for RPM)
+ * @return Null-terminated response from ELM327 (static buffer, valid until the next command)
  */
-int parseHexByte(String response, int byteIndex);
+const char* sendOBD2Command(const char* cmd);
 
 // ============================================================================
 // PID QUERY FUNCTIONS
 // ============================================================================
 
 /**
- * Query engine RPM (PID 0x0C)
- * @return RPM value, or -1 on error
- */
-int queryRPM();
-
-/**
- * Query vehicle speed (PID 0x0D)
- * @return Speed in km/h, or -1 on error
- */
-int querySpeed();
-
-/**
- * Query coolant temperature (PID 0x05)
- * @return Temperature in °C, or -999 on error
- */
-float queryCoolantTemp();
-
-/**
- * Query throttle position (PID 0x11)
- * @return Throttle position in %, or -1 on error
+ * Query several live PIDs with one combined Mode 01 request
+ * (e.g. "01050C0D0F1142") - one adapter round trip instead of one per PID.
+ * PIDs the ECU doesn't support are simply missing from the reply
+ * @param pids PIDs to request (PID_* from config.h, at most MAX_PIDS_PER_REQUEST).
+ *             Must not change while in use - the request string is cached per list
+ * @param count Number of PIDs
+ * @param out Output samples, room for count entries (order follows the reply)
+ * @return Number of samples decoded, or -1 if none could be decoded
  */
-float queryThrottle();
-
-/**
- * Query intake air temperature (PID 0x0F)
- * @return Temperature in °C, or -999 on error
- */
-float queryIntakeTemp();
-
-/**
- * Query battery voltage (PID 0x42)
- * @return Voltage in V, or -1 on error
- */
-float queryBatteryVoltage();
+int queryLivePIDs(const uint8_t* pids, int count, LiveSample* out);
 
 // ============================================================================
 // DTC FUNCTIONS
@@ -101,25 +76,12 @@ float queryBatteryVoltage();
  */
 void parseDTC(uint16_t dtc_value, char* code);
 
-/**
- * Get DTC description from code
- * @param code DTC code (e.g., "P0133")
- * @return Human-readable description
- */
-const char* getDTCDescription(const char* code);
-
-/**
- * Get DTC severity level
- * @param code DTC code (e.g., "P0133")
- * @return Severity level (0=info, 1=warning, 2=critical)
- */
-uint8_t getDTCSeverity(const char* code);
-
 /**
  * Sort DTCs by severity (critical first)
- * Operates on global obd_data.dtc_codes array
+ * @param dtcs DTC array to sort in place
+ * @param count Number of entries
  */
-void sortDTCsBySeverity();
+void sortDTCsBySeverity(DTC* dtcs, int count);
 
 /**
  * Query DTCs from vehicle (Mode 03)
@@ -0,0 +1,152 @@
+/**
+ * ELM327 Reply Parsing
+ *
+ * Byte-level scanners for raw ELM327 replies. Pure C++ (no Arduino or
+ * FreeRTOS dependencies), so the parsers can also be built and tested
+ * on the host - see test/test_elm327_parse
+ */
+
+#ifndef ELM327_PARSE_H
+#define ELM327_PARSE_H
+
+#include <stdint.h>
+#include <string.h>
+
+// ============================================================================
+// HEX SCANNING
+// ============================================================================
+
+// ASCII -> hex digit value, -1 for anything that isn't [0-9A-Fa-f]
+// (one table load per character instead of a chain of range checks)
+static const int8_t HEX_NIBBLE[256] = {
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,  // 0x00
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,  // 0x10
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,  // 0x20
+     0,  1,  2,  3,  4,  5,  6,  7,  8,  9, -1, -1, -1, -1, -1, -1,  // 0x30
+    -1, 10, 11, 12, 13, 14, 15, -1, -1, -1, -1, -1, -1, -1, -1, -1,  // 0x40
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,  // 0x50
+    -1, 10, 11, 12, 13, 14, 15, -1, -1, -1, -1, -1, -1, -1, -1, -1,  // 0x60
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,  // 0x70
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,  // 0x80
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,  // 0x90
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,  // 0xA0
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,  // 0xB0
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,  // 0xC0
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,  // 0xD0
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,  // 0xE0
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,  // 0xF0
+};
+
+inline int hexNibble(char c) {
+    return HEX_NIBBLE[(uint8_t)c];
+}
+
+/**
+ * Read the next hex byte from an ELM327 response
+ * Skips separators and non-hex text (e.g. "SEARCHING...", CAN frame
+ * indices like "0:") between digit pairs
+ * @return Pointer just past the byte, or NULL at the end of the response
+ */
+inline const char* nextHexByte(const char* p, uint8_t* b) {
+    while (*p) {
+        // p[1] is at worst the terminator, which maps to -1
+        int hi = hexNibble(p[0]);
+        int lo = hexNibble(p[1]);
+        if ((hi | lo) < 0) {
+            p++;
+            continue;
+        }
+        *b = (hi << 4) | lo;
+        return p + 2;
+    }
+    return NULL;
+}
+
+// ============================================================================
+// DTC REPLY (MODE 03)
+// ============================================================================
+
+/**
+ * Count the hex byte pairs from p to the end of the current reply line
+ */
+inline int countHexBytesInLine(const char* p) {
+    int n = 0;
+    while (*p && *p != '\r' && *p != '>') {
+        if (hexNibble(p[0]) >= 0 && hexNibble(p[1]) >= 0) {
+            n++;
+            p += 2;
+        } else {
+            p++;
+        }
+    }
+    return n;
+}
+
+/**
+ * Whether a reply is an ISO-TP multi-frame, i.e. some line starts with a
+ * frame index ("0:", "1:", ...). A colon anywhere else doesn't count -
+ * K-line replies can start with "BUS INIT: ...OK"
+ */
+inline bool hasFrameIndices(const char* p) {
+    while (p != NULL && *p) {
+        while (*p == ' ' || *p == '\r' || *p == '\n') p++;  // First token of the line
+        const char* q = p;
+        while (hexNibble(*q) >= 0) q++;
+        if (q > p && *q == ':') {
+            return true;
+        }
+        p = strchr(q, '\r');  // Next line
+    }
+    return false;
+}
+
+/**
+ * Extract raw 16-bit DTC values from a Mode 03 reply in one pass
+ * Handles both reply layouts:
+ * - CAN (ISO 15765): "43 <count> <DTC pairs...>", possibly split over
+ *   ISO-TP frames ("00A\r0: 43 04 01 33 04 20\r1: ..."). Detected by the
+ *   frame indices, or by an odd byte count on a single-frame line
+ * - K-line / J1850: "43 <3 DTC pairs>" per line, 0000 pairs as padding
+ * Each "43" message (one per ECU / line) is parsed on its own
+ * @param values Output DTC values (e.g. 0x0133 for P0133)
+ * @param max Capacity of values
+ * @return Number of DTCs found, or -1 if the reply has no "43" message
+ */
+inline int parseDTCResponse(const char* response, uint16_t* values, int max) {
+    const bool framed = hasFrameIndices(response);
+    const char* p = response;
+    bool found = false;
+    int n = 0;
+    uint8_t b;
+
+    while (n < max && (p = nextHexByte(p, &b)) != NULL) {
+        if (b != 0x43) {
+            continue;  // ISO-TP length line, frame index, or other ECU noise
+        }
+        found = true;
+
+        // Pairs in this message: from the CAN count byte, or 3 per K-line frame
+        int pairs;
+        if (framed || (countHexBytesInLine(p) & 1)) {
+            if ((p = nextHexByte(p, &b)) == NULL) break;
+            pairs = b;
+        } else {
+            pairs = countHexBytesInLine(p) / 2;
+        }
+
+        for (; pairs > 0 && n < max; pairs--) {
+            uint8_t high, low;
+            if ((p = nextHexByte(p, &high)) == NULL) break;
+            if ((p = nextHexByte(p, &low)) == NULL) break;
+            uint16_t value = (high << 8) | low;
+            if (value != 0x0000) {
+                values[n++] = value;  // 0000 = padding, not a DTC
+            }
+        }
+        if (p == NULL) break;
+    }
+
+    return found ? n : -1;
+}
+
+#endif // ELM327_PARSE_H
@@ -13,6 +13,116 @@
 
 OBDData obd_data = {0};
 SemaphoreHandle_t data_mutex;
+QueueHandle_t live_sample_queue;
+QueueHandle_t dtc_command_queue;
+
+// ============================================================================
+// LIVE PID SET
+// ============================================================================
+
+// All live PIDs go out in one combined request per loop iteration
+static const uint8_t LIVE_PIDS[] = {
+    PID_COOLANT_TEMP, PID_RPM, PID_SPEED,
+    PID_INTAKE_TEMP, PID_THROTTLE, PID_BATTERY_VOLTAGE
+};
+static const int LIVE_PID_COUNT = sizeof(LIVE_PIDS) / sizeof(LIVE_PIDS[0]);
+static_assert(LIVE_PID_COUNT <= MAX_PIDS_PER_REQUEST, "Too many PIDs for one request");
+
+/**
+ * Fallback for ECUs that don't answer combined Mode 01 requests:
+ * one round trip per PID
+ * @return Number of samples decoded, or -1 if none could be decoded
+ */
+static int queryLivePIDsOneByOne(LiveSample* out) {
+    int n = 0;
+    for (int i = 0; i < LIVE_PID_COUNT; i++) {
+        if (queryLivePIDs(&LIVE_PIDS[i], 1, &out[n]) > 0) {
+            n++;
+        }
+    }
+    return (n > 0) ? n : -1;
+}
+
+// ============================================================================
+// LIVE SAMPLES
+// ============================================================================
+
+// Last value handed to the display for each LIVE_PIDS entry
+static float last_published[LIVE_PID_COUNT];
+static bool has_published[LIVE_PID_COUNT] = {false};
+
+/**
+ * Forget the last value sent for a PID, so its next reading is sent even
+ * if unchanged (used when a sample never reached the display)
+ */
+static void forgetPublished(uint8_t pid) {
+    for (int i = 0; i < LIVE_PID_COUNT; i++) {
+        if (LIVE_PIDS[i] == pid) has_published[i] = false;
+    }
+}
+
+/**
+ * Hand a live PID value to the display without taking data_mutex
+ * Never blocks: if the display has fallen behind and the queue is full,
+ * the oldest sample is dropped to make room (newer values win).
+ * A value equal to the last one sent for its PID is skipped - a parked
+ * car repeats the same readings every cycle, and resending them only
+ * fills the queue for the display to drain and discard
+ */
+static void publishLiveSample(uint8_t pid, float value) {
+    int idx = 0;
+    while (idx < LIVE_PID_COUNT && LIVE_PIDS[idx] != pid) idx++;
+    if (idx < LIVE_PID_COUNT) {
+        if (has_published[idx] && last_published[idx] == value) {
+            return;
+        }
+        last_published[idx] = value;
+        has_published[idx] = true;
+    }
+
+    LiveSample sample = {pid, value};
+    if (xQueueSend(live_sample_queue, &sample, 0) != pdTRUE) {
+        // The display may drain the queue between the failed send and this
+        // receive - only a sample actually taken out was dropped
+        LiveSample oldest = {0, 0.0f};
+        if (xQueueReceive(live_sample_queue, &oldest, 0) == pdTRUE) {
+            forgetPublished(oldest.pid);
+        }
+        if (xQueueSend(live_sample_queue, &sample, 0) != pdTRUE) {
+            forgetPublished(pid);
+        }
+    }
+}
+
+// Per-sample readings - compiled out unless DEBUG_OBD is set
+// (a Serial write per PID per cycle stalls the OBD2 task at 115200 baud)
+#if DEBUG_OBD
+// printf format for each live reading
+struct LivePIDLog {
+    uint8_t pid;
+    const char* format;
+};
+
+static const LivePIDLog LIVE_PID_LOGS[] = {
+    {PID_RPM,             "RPM: %.0f\n"},
+    {PID_SPEED,           "Speed: %.0f km/h\n"},
+    {PID_COOLANT_TEMP,    "Coolant: %.1f°C\n"},
+    {PID_THROTTLE,        "Throttle: %.1f%%\n"},
+    {PID_INTAKE_TEMP,     "Intake: %.1f°C\n"},
+    {PID_BATTERY_VOLTAGE, "Battery: %.1fV\n"},
+};
+
+static void logLiveSample(const LiveSample& sample) {
+    for (const LivePIDLog& log : LIVE_PID_LOGS) {
+        if (log.pid == sample.pid) {
+            Serial.printf(log.format, sample.value);
+            return;
+        }
+    }
+}
+#else
+static inline void logLiveSample(const LiveSample&) {}
+#endif
 
 // ============================================================================
 // INITIALIZATION
@@ -26,6 +136,20 @@ void initOBD2() {
         while (1) delay(1000);
     }
 
+    // Create queue for live PID samples
+    live_sample_queue = xQueueCreate(LIVE_SAMPLE_QUEUE_LEN, sizeof(LiveSample));
+    if (live_sample_queue == NULL) {
+        Serial.println("ERROR: Failed to create live sample queue!");
+        while (1) delay(1000);
+    }
+
+    // Create queue for DTC requests from the UI
+    dtc_command_queue = xQueueCreate(DTC_COMMAND_QUEUE_LEN, sizeof(uint8_t));
+    if (dtc_command_queue == NULL) {
+        Serial.println("ERROR: Failed to create DTC command queue!");
+        while (1) delay(1000);
+    }
+
     // Initialize Bluetooth
     initBluetooth();
 }
@@ -56,124 +180,64 @@ void obd2Task(void *parameter) {
     obd_data.dtc_fetched = false;
     xSemaphoreGive(data_mutex);
 
-    // Wait a bit for connection to stabilize before querying vehicle info
-    Serial.println("[OBD2 Task] Waiting 3 seconds before querying vehicle info...");
-    vTaskDelay(pdMS_TO_TICKS(3000));
-
     // Query DTCs once after connection
+    // (no settle delay needed - elm327.begin() has already synced on the '>' prompt
+    // and sendOBD2Command() waits for the adapter to finish each reply)
     queryDTCs();
 
     // Query VIN once after connection
     Serial.println("[OBD2 Task] Querying VIN...");
     queryVIN();
 
-    // PID query rotation
-    uint8_t pid_index = 0;
-    const uint8_t pids[] = {
-        PID_RPM,
-        PID_SPEED,
-        PID_COOLANT_TEMP,
-        PID_THROTTLE,
-        PID_INTAKE_TEMP,
-        PID_BATTERY_VOLTAGE
-    };
-    const uint8_t num_pids = sizeof(pids) / sizeof(pids[0]);
-
     Serial.println("[OBD2 Task] Starting query loop...\n");
 
     // Track consecutive failures to detect disconnection
     int consecutive_failures = 0;
     const int MAX_FAILURES_BEFORE_DISCONNECT = 3;
 
+    // Combined requests are assumed to work until they have failed on a
+    // connection where they never succeeded and single PIDs do answer
+    bool combined_pids = true;
+    bool combined_confirmed = false;
+
+    // Protocol is looked up once, after the ECU first answers
+    bool protocol_remembered = false;
+
     while (true) {
-        uint8_t current_pid = pids[pid_index];
-        float value = 0;
-        bool success = false;
-
-        // Query PID using manual functions (bypass ELMduino bug)
-        switch (current_pid) {
-            case PID_RPM:
-                {
-                    int rpm = queryRPM();
-                    if (rpm >= 0) {
-                        xSemaphoreTake(data_mutex, portMAX_DELAY);
-                        obd_data.rpm = rpm;
-                        xSemaphoreGive(data_mutex);
-                        Serial.printf("RPM: %d\n", rpm);
-                        success = true;
-                    }
-                }
-                break;
-
-            case PID_SPEED:
-                {
-                    int spd = querySpeed();
-                    if (spd >= 0) {
-                        xSemaphoreTake(data_mutex, portMAX_DELAY);
-                        obd_data.speed = spd;
-                        xSemaphoreGive(data_mutex);
-                        Serial.printf("Speed: %d km/h\n", spd);
-                        success = true;
-                    }
-                }
-                break;
-
-            case PID_COOLANT_TEMP:
-                {
-                    float temp = queryCoolantTemp();
-                    if (temp > -100) {
-                        xSemaphoreTake(data_mutex, portMAX_DELAY);
-                        obd_data.coolant_temp = temp;
-                        xSemaphoreGive(data_mutex);
-                        Serial.printf("Coolant: %.1f°C\n", temp);
-                        success = true;
-                    }
-                }
-                break;
-
-            case PID_THROTTLE:
-                {
-                    float thr = queryThrottle();
-                    if (thr >= 0) {
-                        xSemaphoreTake(data_mutex, portMAX_DELAY);
-                        obd_data.throttle = thr;
-                        xSemaphoreGive(data_mutex);
-                        Serial.printf("Throttle: %.1f%%\n", thr);
-                        success = true;
-                    }
+        // Query all live PIDs in one round trip (manual parsing - bypasses ELMduino bug)
+        LiveSample samples[LIVE_PID_COUNT];
+        int sample_count;
+        if (combined_pids) {
+            sample_count = queryLivePIDs(LIVE_PIDS, LIVE_PID_COUNT, samples);
+            if (sample_count > 0) {
+                combined_confirmed = true;
+            } else if (!combined_confirmed) {
+                // Probe only before the first combined success, so a lost
+                // connection later doesn't cost a timeout per PID
+                sample_count = queryLivePIDsOneByOne(samples);
+                if (sample_count > 0) {
+                    Serial.println("[OBD2 Task] ECU ignores combined PID requests - querying one PID at a time");
+                    combined_pids = false;
                 }
-                break;
-
-            case PID_INTAKE_TEMP:
-                {
-                    float temp = queryIntakeTemp();
-                    if (temp > -100) {
-                        xSemaphoreTake(data_mutex, portMAX_DELAY);
-                        obd_data.intake_temp = temp;
-                        xSemaphoreGive(data_mutex);
-                        Serial.printf("Intake: %.1f°C\n", temp);
-                        success = true;
-                    }
-                }
-                break;
-
-            case PID_BATTERY_VOLTAGE:
-                {
-                    float volt = queryBatteryVoltage();
-                    if (volt > 0) {
-                        xSemaphoreTake(data_mutex, portMAX_DELAY);
-                        obd_data.battery_voltage = volt;
-                        xSemaphoreGive(data_mutex);
-                        Serial.printf("Battery: %.1fV\n", volt);
-                        success = true;
-                    }
-                }
-                break;
+            }
+        } else {
+            sample_count = queryLivePIDsOneByOne(samples);
+        }
+        bool success = (sample_count > 0);
+
+        if (success && !protocol_remembered) {
+            rememberELM327Protocol();
+            protocol_remembered = true;
+        }
+
+        for (int i = 0; i < sample_count; i++) {
+            publishLiveSample(samples[i].pid, samples[i].value);
+            logLiveSample(samples[i]);
         }
 
         // Check for errors and track consecutive failures
         if (!success) {
-            Serial.printf("PID 0x%02X query failed\n", current_pid);
+            Serial.println("Live PID query failed");
             consecutive_failures++;
 
             // If too many consecutive failures, assume disconnected
@@ -186,58 +250,59 @@ void obd2Task(void *parameter) {
                 snprintf(obd_data.error, sizeof(obd_data.error), "Connection lost (timeout)");
                 xSemaphoreGive(data_mutex);
 
-                // Close existing connection
+                // Close existing connection and restart the Bluetooth stack
+                // (once per connection loss - retries below reuse it)
                 disconnectBluetooth();
-
-                // Reinitialize Bluetooth
                 initBluetooth();
 
                 // Wait before attempting reconnect
                 Serial.println("[OBD2 Task] Waiting 5 seconds before reconnect...");
                 vTaskDelay(pdMS_TO_TICKS(5000));
 
-                // Attempt to reconnect
+                // Retry connecting until the adapter answers, without
+                // going back through failing live queries and a stack restart
                 Serial.println("[OBD2 Task] Attempting to reconnect...");
-                if (connectToELM327()) {
-                    Serial.println("[OBD2 Task] Reconnected successfully!");
-                    xSemaphoreTake(data_mutex, portMAX_DELAY);
-                    obd_data.connected = true;
-                    obd_data.error[0] = '\0';
-                    xSemaphoreGive(data_mutex);
-                    consecutive_failures = 0;  // Reset failure counter
-                } else {
+                while (!connectToELM327()) {
                     Serial.println("[OBD2 Task] Reconnection failed, will retry...");
-                    consecutive_failures = 0;  // Reset to try again
                     vTaskDelay(pdMS_TO_TICKS(2000));
-                    continue;  // Skip to next iteration
                 }
+
+                Serial.println("[OBD2 Task] Reconnected successfully!");
+                xSemaphoreTake(data_mutex, portMAX_DELAY);
+                obd_data.connected = true;
+                obd_data.error[0] = '\0';
+                xSemaphoreGive(data_mutex);
+                consecutive_failures = 0;  // Reset failure counter
+
+                // Adapter may have reset - find out again whether combined requests work
+                combined_pids = true;
+                combined_confirmed = false;
             }
         } else {
             // Success - reset failure counter
             consecutive_failures = 0;
         }
 
-        // Move to next PID
-        pid_index = (pid_index + 1) % num_pids;
-
         // Check for DTC operation requests (from UI thread)
+        // Drain the command queue without waiting; repeated requests of the
+        // same kind collapse into one operation
         bool dtc_refresh_req = false;
         bool dtc_clear_req = false;
 
-        xSemaphoreTake(data_mutex, portMAX_DELAY);
-        dtc_refresh_req = obd_data.dtc_refresh_requested;
-        dtc_clear_req = obd_data.dtc_clear_requested;
-        xSemaphoreGive(data_mutex);
+        uint8_t dtc_cmd;
+        while (xQueueReceive(dtc_command_queue, &dtc_cmd, 0) == pdTRUE) {
+            if (dtc_cmd == DTC_CMD_CLEAR) {
+                dtc_clear_req = true;
+            } else if (dtc_cmd == DTC_CMD_REFRESH) {
+                dtc_refresh_req = true;
+            }
+        }
 
         // Handle DTC Clear request
         if (dtc_clear_req) {
             Serial.println("[OBD2 Task] Processing DTC clear request...");
             bool clear_success = clearAllDTCs();
 
-            xSemaphoreTake(data_mutex, portMAX_DELAY);
-            obd_data.dtc_clear_requested = false;  // Clear flag
-            xSemaphoreGive(data_mutex);
-
             if (clear_success) {
                 Serial.println("[OBD2 Task] DTCs cleared successfully");
                 // Query DTCs to update display
@@ -252,14 +317,11 @@ void obd2Task(void *parameter) {
             Serial.println("[OBD2 Task] Processing DTC refresh request...");
             queryDTCs();
 
-            xSemaphoreTake(data_mutex, portMAX_DELAY);
-            obd_data.dtc_refresh_requested = false;  // Clear flag
-            xSemaphoreGive(data_mutex);
-
             Serial.println("[OBD2 Task] DTC refresh complete");
         }
 
-        // Wait before next query
-        vTaskDelay(pdMS_TO_TICKS(OBD2_QUERY_INTERVAL_MS));
+        // No fixed sleep: each query already blocks until the ELM327
+        // prompt, so just yield briefly before sending the next one
+        vTaskDelay(pdMS_TO_TICKS(OBD2_QUERY_GAP_MS));
     }
 }
@@ -9,6 +9,7 @@
 #define OBD_DATA_H
 
 #include <Arduino.h>
+#include "config.h"
 
 // ============================================================================
 // DTC DEFINITIONS
@@ -21,7 +22,7 @@
 
 struct DTC {
     char code[6];           // e.g., "P0133"
-    char description[80];   // e.g., "O2 Sensor Slow Response"
+    const char* description; // e.g., "O2 Sensor Slow Response" (points into const DTC table in flash)
     uint8_t severity;       // 0=info, 1=warning, 2=critical
 };
 
@@ -29,13 +30,71 @@ struct DTC {
 // OBD DATA STRUCTURE
 // ============================================================================
 
-struct OBDData {
+// Live PID values - kept together so they can be copied as one small block
+struct OBDLiveData {
     float coolant_temp;      // °C
     uint16_t rpm;            // RPM
     uint8_t speed;           // km/h
     float battery_voltage;   // V
     float intake_temp;       // °C
     float throttle;          // %
+    uint8_t dirty;           // LIVE_DIRTY_* bits of fields changed since the display last drew them
+};
+
+// Dirty bits for OBDLiveData fields (one per dashboard box)
+#define LIVE_DIRTY_COOLANT      (1 << 0)
+#define LIVE_DIRTY_RPM          (1 << 1)
+#define LIVE_DIRTY_SPEED        (1 << 2)
+#define LIVE_DIRTY_BATTERY      (1 << 3)
+#define LIVE_DIRTY_INTAKE       (1 << 4)
+#define LIVE_DIRTY_THROTTLE     (1 << 5)
+#define LIVE_DIRTY_ALL          0x3F
+
+// One live PID reading, passed from the OBD2 task to the display through
+// live_sample_queue (single producer / single consumer, never blocks)
+struct LiveSample {
+    uint8_t pid;             // PID_* from config.h
+    float value;             // Decoded value in the units of OBDLiveData
+};
+
+// DTC operations requested by the UI thread, passed to the OBD2 task
+// through dtc_command_queue (single producer / single consumer)
+enum DTCCommand : uint8_t {
+    DTC_CMD_REFRESH,         // Re-read DTCs from the ECU
+    DTC_CMD_CLEAR            // Clear all DTCs, then re-read
+};
+
+/**
+ * Store a live value and mark its field dirty only if it actually changed
+ */
+template <typename T>
+inline void setLiveField(T& field, T value, uint8_t& dirty, uint8_t bit) {
+    if (field != value) {
+        field = value;
+        dirty |= bit;
+    }
+}
+
+/**
+ * Apply one sample to a live value block, flagging the field it changed
+ * This switch is the one PID -> field mapping on the display side; it
+ * compiles to a single integer dispatch (no lookups or compares by name)
+ * and runs outside any lock
+ * @param live Live value block to update
+ * @param sample Sample received from live_sample_queue
+ */
+inline void applyLiveSample(OBDLiveData& live, const LiveSample& sample) {
+    switch (sample.pid) {
+        case PID_RPM:             setLiveField(live.rpm, (uint16_t)sample.value, live.dirty, LIVE_DIRTY_RPM); break;
+        case PID_SPEED:           setLiveField(live.speed, (uint8_t)sample.value, live.dirty, LIVE_DIRTY_SPEED); break;
+        case PID_COOLANT_TEMP:    setLiveField(live.coolant_temp, sample.value, live.dirty, LIVE_DIRTY_COOLANT); break;
+        case PID_THROTTLE:        setLiveField(live.throttle, sample.value, live.dirty, LIVE_DIRTY_THROTTLE); break;
+        case PID_INTAKE_TEMP:     setLiveField(live.intake_temp, sample.value, live.dirty, LIVE_DIRTY_INTAKE); break;
+        case PID_BATTERY_VOLTAGE: setLiveField(live.battery_voltage, sample.value, live.dirty, LIVE_DIRTY_BATTERY); break;
+    }
+}
+
+struct OBDData {
     bool connected;          // ELM327 connection status
     char error[64];          // Error message
 
@@ -44,10 +103,6 @@ struct OBDData {
     uint8_t dtc_count;       // Number of active DTCs
     bool dtc_fetched;        // Whether DTCs have been fetched
 
-    // DTC Request Flags (set by UI thread, cleared by OBD2 task)
-    bool dtc_refresh_requested;  // Request DTC refresh from ECU
-    bool dtc_clear_requested;    // Request clear all DTCs
-
     // Vehicle Information (fetched once at startup)
     char vin[18];                // Vehicle Identification Number (17 chars + null)
     bool vin_fetched;            // Whether VIN has been fetched
@@ -59,5 +114,18 @@ struct OBDData {
 
 extern OBDData obd_data;
 extern SemaphoreHandle_t data_mutex;
+extern QueueHandle_t live_sample_queue;  // Live PID samples (OBD2 task -> display), see LiveSample
+extern QueueHandle_t dtc_command_queue;  // DTC requests (UI -> OBD2 task), see DTCCommand
+
+/**
+ * Queue a DTC operation for the OBD2 task (called from the UI thread)
+ * Never blocks; repeated presses while the OBD2 task is busy are merged
+ * when it drains the queue
+ * @return False if the queue is full and the request was dropped
+ */
+inline bool requestDTCCommand(DTCCommand command) {
+    uint8_t cmd = command;
+    return xQueueSend(dtc_command_queue, &cmd, 0) == pdTRUE;
+}
 
 #endif // OBD_DATA_H
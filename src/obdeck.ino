@@ -37,6 +37,7 @@ TFT_eSPI tft = TFT_eSPI();
 // Current page state
 Page current_page = PAGE_DASHBOARD;  // Start with Dashboard page
 bool page_needs_redraw = true;
+bool content_needs_redraw = false;
 
 // Button navigation state (shared across all modules)
 int current_button_index = 0;  // Start with Dashboard button highlighted
@@ -50,14 +51,16 @@ void setup() {
       Serial.begin(115200);
       delay(1000);
 
-      Serial.println("\n\n");
-      Serial.println("========================================");
-      Serial.println("OBDeck - ESP32 OBD2 Display System");
-      Serial.println("========================================");
-      Serial.printf("Hardware: %s %d\n", VEHICLE_NAME, VEHICLE_YEAR);
-      Serial.printf("Display: ILI9488 %dx%d\n", SCREEN_WIDTH, SCREEN_HEIGHT);
-      Serial.println("OBD2: ELM327 Bluetooth");
-      Serial.println("========================================\n");
+      // Banner in a single UART write
+      Serial.printf("\n\n\n"
+                    "========================================\n"
+                    "OBDeck - ESP32 OBD2 Display System\n"
+                    "========================================\n"
+                    "Hardware: %s %d\n"
+                    "Display: ILI9488 %dx%d\n"
+                    "OBD2: ELM327 Bluetooth\n"
+                    "========================================\n\n",
+                    VEHICLE_NAME, VEHICLE_YEAR, SCREEN_WIDTH, SCREEN_HEIGHT);
 
       // Initialize OBD2 module (creates mutex and initializes Bluetooth)
       initOBD2();
@@ -83,8 +86,8 @@ void setup() {
           OBD2_TASK_CORE           // Core (0)
       );
 
-      Serial.println("✓ OBD2 task started on Core 0");
-      Serial.println("\nSetup complete! Entering main loop...\n");
+      Serial.println("✓ OBD2 task started on Core 0\n"
+                     "\nSetup complete! Entering main loop...\n");
   }
 
 void loop() {
@@ -101,11 +104,15 @@ void loop() {
     }
 
     // Handle physical button input for navigation
-    OBDData data_copy_buttons;
-    xSemaphoreTake(data_mutex, portMAX_DELAY);
-    data_copy_buttons = obd_data;
-    xSemaphoreGive(data_mutex);
-    handleButtonInput(current_page, page_needs_redraw, data_copy_buttons.dtc_count);
+    // (only the DTC count is needed - don't copy the whole OBDData every 10ms)
+    // Polled 100x/s, so never wait for the lock: keep the last known count
+    // if the OBD2 task is holding it
+    static uint8_t dtc_count = 0;
+    if (xSemaphoreTake(data_mutex, 0) == pdTRUE) {
+        dtc_count = obd_data.dtc_count;
+        xSemaphoreGive(data_mutex);
+    }
+    handleButtonInput(current_page, page_needs_redraw, dtc_count);
 
     // Force immediate first draw to clear startup screen
     if (first_draw) {
@@ -120,5 +127,11 @@ void loop() {
         last_update = millis();
     }
 
-    delay(10);  // Small delay to prevent WDT issues
+    // Sleep until there is work: the next scheduled redraw, the end of a
+    // button debounce window, or a button edge (the ISR notifies this task).
+    // Blocking here also lets the idle task run, so the WDT stays fed
+    uint32_t since_draw = millis() - last_update;
+    uint32_t wait_ms = (since_draw < DISPLAY_REFRESH_MS) ? DISPLAY_REFRESH_MS - since_draw : 0;
+    wait_ms = min(wait_ms, buttonIdleMs());
+    ulTaskNotifyTake(pdTRUE, pdMS_TO_TICKS(wait_ms));
 }
@@ -0,0 +1,83 @@
+/**
+ * Host tests for the ELM327 reply parsers
+ * Run with: pio test -e native
+ */
+
+#include <unity.h>
+#include "../../src/obd2/elm327_parse.h"
+
+static uint16_t values[12];
+static const int MAX_VALUES = sizeof(values) / sizeof(values[0]);
+
+void setUp() {
+    memset(values, 0, sizeof(values));
+}
+
+void tearDown() {}
+
+// ============================================================================
+// FRAME DETECTION
+// ============================================================================
+
+void test_frame_indices_detected() {
+    TEST_ASSERT_TRUE(hasFrameIndices("00A\r0: 43 04 01 33 04 20\r1: 01 71 01 72\r\r>"));
+}
+
+void test_bus_init_colon_is_not_a_frame_index() {
+    TEST_ASSERT_FALSE(hasFrameIndices("BUS INIT: ...OK\r43 01 33 00 00 00 00\r\r>"));
+}
+
+void test_single_line_reply_has_no_frame_indices() {
+    TEST_ASSERT_FALSE(hasFrameIndices("43 01 33 00 00 00 00\r\r>"));
+}
+
+// ============================================================================
+// MODE 03 REPLIES
+// ============================================================================
+
+void test_kline_reply_after_bus_init() {
+    int n = parseDTCResponse("BUS INIT: ...OK\r43 01 33 00 00 00 00\r\r>", values, MAX_VALUES);
+    TEST_ASSERT_EQUAL_INT(1, n);
+    TEST_ASSERT_EQUAL_HEX16(0x0133, values[0]);
+}
+
+void test_kline_reply_three_codes() {
+    int n = parseDTCResponse("43 01 33 04 20 01 71\r\r>", values, MAX_VALUES);
+    TEST_ASSERT_EQUAL_INT(3, n);
+    TEST_ASSERT_EQUAL_HEX16(0x0133, values[0]);
+    TEST_ASSERT_EQUAL_HEX16(0x0420, values[1]);
+    TEST_ASSERT_EQUAL_HEX16(0x0171, values[2]);
+}
+
+void test_can_single_frame_uses_count_byte() {
+    int n = parseDTCResponse("43 02 01 33 04 20\r\r>", values, MAX_VALUES);
+    TEST_ASSERT_EQUAL_INT(2, n);
+    TEST_ASSERT_EQUAL_HEX16(0x0133, values[0]);
+    TEST_ASSERT_EQUAL_HEX16(0x0420, values[1]);
+}
+
+void test_can_multi_frame_reply() {
+    int n = parseDTCResponse("00A\r0: 43 04 01 33 04 20\r1: 01 71 01 72 00 00\r\r>", values, MAX_VALUES);
+    TEST_ASSERT_EQUAL_INT(4, n);
+    TEST_ASSERT_EQUAL_HEX16(0x0133, values[0]);
+    TEST_ASSERT_EQUAL_HEX16(0x0420, values[1]);
+    TEST_ASSERT_EQUAL_HEX16(0x0171, values[2]);
+    TEST_ASSERT_EQUAL_HEX16(0x0172, values[3]);
+}
+
+void test_no_data_reply() {
+    TEST_ASSERT_EQUAL_INT(-1, parseDTCResponse("NO DATA\r\r>", values, MAX_VALUES));
+}
+
+int main() {
+    UNITY_BEGIN();
+    RUN_TEST(test_frame_indices_detected);
+    RUN_TEST(test_bus_init_colon_is_not_a_frame_index);
+    RUN_TEST(test_single_line_reply_has_no_frame_indices);
+    RUN_TEST(test_kline_reply_after_bus_init);
+    RUN_TEST(test_kline_reply_three_codes);
+    RUN_TEST(test_can_single_frame_uses_count_byte);
+    RUN_TEST(test_can_multi_frame_reply);
+    RUN_TEST(test_no_data_reply);
+    return UNITY_END();
+}